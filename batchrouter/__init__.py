@@ -1,5 +1,6 @@
 """BatchRouter Python SDK - Cost-optimized batch LLM inference routing."""
 
+from batchrouter.async_client import AsyncBatchRouter
 from batchrouter.client import BatchRouter
 from batchrouter.exceptions import (
     AuthenticationError,
@@ -22,6 +23,7 @@ __version__ = "0.1.0"
 __all__ = [
     # Client
     "BatchRouter",
+    "AsyncBatchRouter",
     # Types
     "Dataset",
     "DatasetUploadResponse",
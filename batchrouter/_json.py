@@ -0,0 +1,27 @@
+"""JSON encoding for request and response bodies.
+
+Uses orjson when it is installed (pip install "batchrouter[orjson]") and
+falls back to the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+loads: Callable[[bytes | str], Any]
+dumps: Callable[[Any], bytes]
+
+try:
+    import orjson
+except ImportError:
+    import json
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+else:
+    loads = orjson.loads
+    dumps = orjson.dumps
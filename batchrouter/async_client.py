@@ -0,0 +1,249 @@
+"""Async BatchRouter client for interacting with the API."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cached_property
+from typing import Any, BinaryIO
+
+import httpx
+
+from batchrouter._json import dumps, loads
+from batchrouter.batches import AsyncBatches
+from batchrouter.client import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_LIMITS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_MAX,
+    DEFAULT_TIMEOUT,
+    DEFAULT_TRANSPORT_RETRIES,
+    HTTP2_AVAILABLE,
+    _BaseClient,
+)
+from batchrouter.datasets import AsyncDatasets
+from batchrouter.models import AsyncModels
+
+
+class AsyncBatchRouter(_BaseClient):
+    """Async BatchRouter API client.
+
+    Mirrors `BatchRouter`, but every API method is a coroutine, so many
+    requests can be in flight at once.
+
+    Args:
+        api_key: Your BatchRouter API key (starts with "br_").
+            If not provided, will look for BATCHROUTER_API_KEY env var.
+        base_url: API base URL. Defaults to https://api.batchrouter.ai
+        timeout: Request timeout in seconds. Defaults to 60.
+        cache_ttl: Seconds to reuse model catalogue responses. Defaults to 300;
+            0 disables caching.
+        max_retries: Retries for rate-limited (429), gateway error (502/503/504)
+            and failed connection attempts. Defaults to 3; 0 disables retries.
+        retry_backoff: Base delay in seconds for exponential backoff. Defaults to 0.5.
+        retry_max: Maximum delay in seconds between retries. Defaults to 30.
+
+    Example:
+        ```python
+        import asyncio
+
+        from batchrouter import AsyncBatchRouter
+
+        async def main():
+            async with AsyncBatchRouter(api_key="br_...") as client:
+                # Check several batch jobs concurrently
+                jobs = await asyncio.gather(
+                    *[client.batches.get(batch_id) for batch_id in batch_ids]
+                )
+                for job in jobs:
+                    print(f"{job.id}: {job.status}")
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        retry_max: float = DEFAULT_RETRY_MAX,
+    ):
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            retry_max=retry_max,
+        )
+        # Paths are joined onto this base by httpx, which parses it only once
+        self._client = httpx.AsyncClient(
+            base_url=f"{self._base_url}/api",
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=DEFAULT_LIMITS,
+                retries=DEFAULT_TRANSPORT_RETRIES,
+            ),
+        )
+
+    # Resource classes are created on first access
+    @cached_property
+    def datasets(self) -> AsyncDatasets:
+        """Dataset operations."""
+        return AsyncDatasets(self)
+
+    @cached_property
+    def batches(self) -> AsyncBatches:
+        """Batch job operations."""
+        return AsyncBatches(self)
+
+    @cached_property
+    def models(self) -> AsyncModels:
+        """Model listing and information."""
+        return AsyncModels(self)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make an API request and return JSON response."""
+        headers = self._headers_multipart if files else self._headers_json
+
+        response = await self._send(
+            method,
+            path,
+            replayable=self._is_replayable(files),
+            headers=headers,
+            params=params,
+            content=None if json is None else dumps(json),
+            data=data,
+            files=files,
+        )
+
+        status_code = response.status_code
+        if status_code >= 300:
+            self._handle_error(response)
+
+        if status_code == 204:
+            return None
+
+        return loads(response.content)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        replayable: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.request(method, path, **kwargs)
+            except httpx.TransportError:
+                if not self._should_retry(method, attempt, replayable=replayable):
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                if not self._should_retry(method, attempt, response, replayable):
+                    return response
+                await response.aclose()
+                delay = self._retry_delay(attempt, response)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _cached_request(self, path: str) -> Any:
+        """Make a GET request, reusing a cached response within the TTL."""
+        hit, response = self._cache_get(path)
+        if hit:
+            return response
+
+        response = await self._request("GET", path)
+        self._cache_set(path, response)
+        return response
+
+    async def _request_raw(self, method: str, path: str) -> bytes:
+        """Make an API request and return raw bytes (for file downloads)."""
+        buffer = io.BytesIO()
+        await self._stream(method, path, buffer)
+        return buffer.getvalue()
+
+    async def _stream(
+        self,
+        method: str,
+        path: str,
+        sink: BinaryIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Make an API request and write the response body to sink chunk by chunk."""
+        async with self._open_stream(method, path) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
+                sink.write(chunk)
+
+    @asynccontextmanager
+    async def _open_stream(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[httpx.Response]:
+        """Open a streamed API response with a successful status.
+
+        Transient failures are retried until the body is handed to the caller.
+        """
+        if headers is None:
+            headers = self._headers_json
+
+        attempt = 0
+        while True:
+            body_started = False
+            try:
+                async with self._client.stream(method, path, headers=headers, **kwargs) as response:
+                    if not self._should_retry(method, attempt, response):
+                        if response.status_code >= 300:
+                            await response.aread()
+                            self._handle_error(response)
+
+                        # Data the caller already consumed can't be taken back, so
+                        # failures past this point are not retried
+                        body_started = True
+                        yield response
+                        return
+
+                    delay = self._retry_delay(attempt, response)
+            except httpx.TransportError:
+                if body_started or not self._should_retry(method, attempt):
+                    raise
+                delay = self._retry_delay(attempt)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncBatchRouter":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
+import httpx
+
+from batchrouter._json import loads
+from batchrouter.exceptions import NotFoundError, ServerError
 from batchrouter.types import BatchCreateResponse, BatchJob
 
 if TYPE_CHECKING:
+    from batchrouter.async_client import AsyncBatchRouter
     from batchrouter.client import BatchRouter
 
+# Statuses after which a batch job no longer changes
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled", "expired"})
+
+_NDJSON = "application/x-ndjson"
+
 
 class Batches:
     """Batch job operations."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: "BatchRouter"):
         self._client = client
 
@@ -34,17 +50,16 @@ class Batches:
         Returns:
             BatchCreateResponse with job id, status, and cost estimate
         """
-        payload: dict[str, str | None] = {
-            "dataset_name": dataset_name,
-            "model": model,
-        }
-        if provider:
-            payload["provider"] = provider
-        if description:
-            payload["description"] = description
+        fields = (
+            ("dataset_name", dataset_name),
+            ("model", model),
+            ("provider", provider),
+            ("description", description),
+        )
+        payload = {key: value for key, value in fields if value is not None}
 
         response = self._client._request("POST", "/v1/batches", json=payload)
-        return BatchCreateResponse(**response)
+        return BatchCreateResponse._from_dict(response)
 
     def list(self, page: int = 1, page_size: int = 20) -> list[BatchJob]:
         """List all batch jobs.
@@ -61,7 +76,47 @@ class Batches:
             "/v1/batches",
             params={"page": page, "page_size": page_size},
         )
-        return [BatchJob(**b) for b in response.get("data", [])]
+        return [BatchJob._from_dict(b) for b in response.get("data", [])]
+
+    def iter_all(self, page_size: int = 100) -> Iterator[BatchJob]:
+        """Iterate over all batch jobs.
+
+        Jobs are requested as newline-delimited JSON and parsed as each line
+        arrives, so memory use doesn't grow with the number of jobs and
+        breaking out of the loop stops the download. If the server responds
+        with regular JSON instead, the listing is paged through.
+
+        Args:
+            page_size: Number of jobs per request
+
+        Yields:
+            BatchJob objects
+        """
+        with self._client._open_stream(
+            "GET",
+            "/v1/batches",
+            headers={**self._client._headers_json, "Accept": _NDJSON},
+            params={"page_size": page_size},
+        ) as response:
+            if response.headers.get("content-type", "").startswith(_NDJSON):
+                for line in response.iter_lines():
+                    if line:
+                        yield BatchJob._from_dict(loads(line))
+                return
+            data = loads(response.read())
+
+        page = 1
+        while True:
+            for b in data.get("data", []):
+                yield BatchJob._from_dict(b)
+            if not data.get("has_more"):
+                return
+            page += 1
+            data = self._client._request(
+                "GET",
+                "/v1/batches",
+                params={"page": page, "page_size": page_size},
+            )
 
     def get(self, batch_id: str) -> BatchJob:
         """Get a batch job by ID.
@@ -73,7 +128,7 @@ class Batches:
             BatchJob object with current status and progress
         """
         response = self._client._request("GET", f"/v1/batches/{batch_id}")
-        return BatchJob(**response)
+        return BatchJob._from_dict(response)
 
     def cancel(self, batch_id: str) -> BatchJob:
         """Cancel a batch job.
@@ -85,7 +140,114 @@ class Batches:
             Updated BatchJob object
         """
         response = self._client._request("POST", f"/v1/batches/{batch_id}/cancel")
-        return BatchJob(**response)
+        return BatchJob._from_dict(response)
+
+    def wait(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        timeout: float | None = None,
+        backoff: float = 1.5,
+        max_interval: float = 60.0,
+    ) -> BatchJob:
+        """Wait for a batch job to reach a terminal status.
+
+        Polls the job with exponential backoff until it is completed, failed,
+        cancelled or expired.
+
+        Args:
+            batch_id: The batch job ID
+            poll_interval: Seconds to wait before the first re-check
+            timeout: Maximum seconds to wait (default: wait indefinitely)
+            backoff: Factor the interval grows by after each poll
+            max_interval: Upper bound for the interval between polls
+
+        Returns:
+            BatchJob object in a terminal status
+
+        Raises:
+            TimeoutError: If the job is still running after timeout seconds
+        """
+        for job in self._poll(batch_id, poll_interval, timeout, backoff, max_interval):
+            pass
+        return job
+
+    def stream_status(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        backoff: float = 1.5,
+        max_interval: float = 60.0,
+    ) -> Iterator[BatchJob]:
+        """Iterate over status changes of a batch job until it finishes.
+
+        Updates are pushed by the server as server-sent events over a single
+        long-lived connection. If the events endpoint is missing or failing, or
+        the stream ends, drops or sends nothing for the client timeout, the job
+        is polled like `wait` does instead.
+
+        Args:
+            batch_id: The batch job ID
+            poll_interval: Seconds between the first polls when falling back
+            backoff: Factor the polling interval grows by after each poll
+            max_interval: Upper bound for the interval between polls
+
+        Yields:
+            BatchJob objects, the last one in a terminal status
+        """
+        last = None
+        try:
+            with self._client._open_stream(
+                "GET",
+                f"/v1/batches/{batch_id}/events",
+                headers={**self._client._headers_json, "Accept": "text/event-stream"},
+            ) as response:
+                for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    last = BatchJob._from_dict(loads(line[5:]))
+                    yield last
+                    if last.status in TERMINAL_STATUSES:
+                        return
+        except (NotFoundError, ServerError, httpx.TransportError):
+            # The connection is often dropped, or goes quiet for longer than
+            # the client timeout, well before the job finishes
+            pass
+
+        for job in self._poll(batch_id, poll_interval, None, backoff, max_interval):
+            if job != last:
+                last = job
+                yield job
+
+    def _poll(
+        self,
+        batch_id: str,
+        poll_interval: float,
+        timeout: float | None,
+        backoff: float,
+        max_interval: float,
+    ) -> Iterator[BatchJob]:
+        """Get a batch job with exponential backoff until it reaches a terminal status."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            job = self.get(batch_id)
+            yield job
+            if job.status in TERMINAL_STATUSES:
+                return
+
+            delay = min(interval, max_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Batch {batch_id} did not finish within {timeout} seconds "
+                        f"(last status: {job.status})"
+                    )
+                delay = min(delay, remaining)
+
+            time.sleep(delay)
+            interval *= backoff
 
     def download_results(self, batch_id: str) -> bytes:
         """Download batch job results as JSONL.
@@ -108,3 +270,307 @@ class Batches:
             JSONL content as bytes (may be empty if no errors)
         """
         return self._client._request_raw("GET", f"/v1/batches/{batch_id}/errors")
+
+    def download_results_to(self, batch_id: str, file: str | Path | BinaryIO) -> None:
+        """Stream batch job results as JSONL into a file.
+
+        Unlike `download_results`, the body is never held in memory as a whole.
+
+        Args:
+            batch_id: The batch job ID
+            file: Path to write to or writable binary file-like object
+        """
+        self._download_to(f"/v1/batches/{batch_id}/results", file)
+
+    def download_errors_to(self, batch_id: str, file: str | Path | BinaryIO) -> None:
+        """Stream batch job errors as JSONL into a file.
+
+        Args:
+            batch_id: The batch job ID
+            file: Path to write to or writable binary file-like object
+        """
+        self._download_to(f"/v1/batches/{batch_id}/errors", file)
+
+    def _download_to(self, path: str, file: str | Path | BinaryIO) -> None:
+        """Internal method to stream a download into a path or file object."""
+        if isinstance(file, (str, Path)):
+            with open(file, "wb") as f:
+                self._client._stream("GET", path, f)
+        else:
+            self._client._stream("GET", path, file)
+
+
+class AsyncBatches:
+    """Async batch job operations."""
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: "AsyncBatchRouter"):
+        self._client = client
+
+    async def create(
+        self,
+        dataset_name: str,
+        model: str = "auto",
+        provider: str | None = None,
+        description: str | None = None,
+    ) -> BatchCreateResponse:
+        """Create a new batch job.
+
+        Args:
+            dataset_name: Name of the dataset to process
+            model: Model to use (default "auto" for cheapest routing)
+            provider: Optional specific provider (e.g., "openai", "anthropic")
+            description: Optional job description
+
+        Returns:
+            BatchCreateResponse with job id, status, and cost estimate
+        """
+        fields = (
+            ("dataset_name", dataset_name),
+            ("model", model),
+            ("provider", provider),
+            ("description", description),
+        )
+        payload = {key: value for key, value in fields if value is not None}
+
+        response = await self._client._request("POST", "/v1/batches", json=payload)
+        return BatchCreateResponse._from_dict(response)
+
+    async def list(self, page: int = 1, page_size: int = 20) -> list[BatchJob]:
+        """List all batch jobs.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+
+        Returns:
+            List of BatchJob objects
+        """
+        response = await self._client._request(
+            "GET",
+            "/v1/batches",
+            params={"page": page, "page_size": page_size},
+        )
+        return [BatchJob._from_dict(b) for b in response.get("data", [])]
+
+    async def iter_all(self, page_size: int = 100) -> AsyncIterator[BatchJob]:
+        """Iterate over all batch jobs.
+
+        Jobs are requested as newline-delimited JSON and parsed as each line
+        arrives, so memory use doesn't grow with the number of jobs and
+        breaking out of the loop stops the download. If the server responds
+        with regular JSON instead, the listing is paged through.
+
+        Args:
+            page_size: Number of jobs per request
+
+        Yields:
+            BatchJob objects
+        """
+        async with self._client._open_stream(
+            "GET",
+            "/v1/batches",
+            headers={**self._client._headers_json, "Accept": _NDJSON},
+            params={"page_size": page_size},
+        ) as response:
+            if response.headers.get("content-type", "").startswith(_NDJSON):
+                async for line in response.aiter_lines():
+                    if line:
+                        yield BatchJob._from_dict(loads(line))
+                return
+            data = loads(await response.aread())
+
+        page = 1
+        while True:
+            for b in data.get("data", []):
+                yield BatchJob._from_dict(b)
+            if not data.get("has_more"):
+                return
+            page += 1
+            data = await self._client._request(
+                "GET",
+                "/v1/batches",
+                params={"page": page, "page_size": page_size},
+            )
+
+    async def get(self, batch_id: str) -> BatchJob:
+        """Get a batch job by ID.
+
+        Args:
+            batch_id: The batch job ID
+
+        Returns:
+            BatchJob object with current status and progress
+        """
+        response = await self._client._request("GET", f"/v1/batches/{batch_id}")
+        return BatchJob._from_dict(response)
+
+    async def cancel(self, batch_id: str) -> BatchJob:
+        """Cancel a batch job.
+
+        Args:
+            batch_id: The batch job ID to cancel
+
+        Returns:
+            Updated BatchJob object
+        """
+        response = await self._client._request("POST", f"/v1/batches/{batch_id}/cancel")
+        return BatchJob._from_dict(response)
+
+    async def wait(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        timeout: float | None = None,
+        backoff: float = 1.5,
+        max_interval: float = 60.0,
+    ) -> BatchJob:
+        """Wait for a batch job to reach a terminal status.
+
+        Polls the job with exponential backoff until it is completed, failed,
+        cancelled or expired.
+
+        Args:
+            batch_id: The batch job ID
+            poll_interval: Seconds to wait before the first re-check
+            timeout: Maximum seconds to wait (default: wait indefinitely)
+            backoff: Factor the interval grows by after each poll
+            max_interval: Upper bound for the interval between polls
+
+        Returns:
+            BatchJob object in a terminal status
+
+        Raises:
+            TimeoutError: If the job is still running after timeout seconds
+        """
+        async for job in self._poll(batch_id, poll_interval, timeout, backoff, max_interval):
+            pass
+        return job
+
+    async def stream_status(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        backoff: float = 1.5,
+        max_interval: float = 60.0,
+    ) -> AsyncIterator[BatchJob]:
+        """Iterate over status changes of a batch job until it finishes.
+
+        Updates are pushed by the server as server-sent events over a single
+        long-lived connection. If the events endpoint is missing or failing, or
+        the stream ends, drops or sends nothing for the client timeout, the job
+        is polled like `wait` does instead.
+
+        Args:
+            batch_id: The batch job ID
+            poll_interval: Seconds between the first polls when falling back
+            backoff: Factor the polling interval grows by after each poll
+            max_interval: Upper bound for the interval between polls
+
+        Yields:
+            BatchJob objects, the last one in a terminal status
+        """
+        last = None
+        try:
+            async with self._client._open_stream(
+                "GET",
+                f"/v1/batches/{batch_id}/events",
+                headers={**self._client._headers_json, "Accept": "text/event-stream"},
+            ) as response:
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    last = BatchJob._from_dict(loads(line[5:]))
+                    yield last
+                    if last.status in TERMINAL_STATUSES:
+                        return
+        except (NotFoundError, ServerError, httpx.TransportError):
+            # The connection is often dropped, or goes quiet for longer than
+            # the client timeout, well before the job finishes
+            pass
+
+        async for job in self._poll(batch_id, poll_interval, None, backoff, max_interval):
+            if job != last:
+                last = job
+                yield job
+
+    async def _poll(
+        self,
+        batch_id: str,
+        poll_interval: float,
+        timeout: float | None,
+        backoff: float,
+        max_interval: float,
+    ) -> AsyncIterator[BatchJob]:
+        """Get a batch job with exponential backoff until it reaches a terminal status."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            job = await self.get(batch_id)
+            yield job
+            if job.status in TERMINAL_STATUSES:
+                return
+
+            delay = min(interval, max_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Batch {batch_id} did not finish within {timeout} seconds "
+                        f"(last status: {job.status})"
+                    )
+                delay = min(delay, remaining)
+
+            await asyncio.sleep(delay)
+            interval *= backoff
+
+    async def download_results(self, batch_id: str) -> bytes:
+        """Download batch job results as JSONL.
+
+        Args:
+            batch_id: The batch job ID
+
+        Returns:
+            JSONL content as bytes
+        """
+        return await self._client._request_raw("GET", f"/v1/batches/{batch_id}/results")
+
+    async def download_errors(self, batch_id: str) -> bytes:
+        """Download batch job errors as JSONL.
+
+        Args:
+            batch_id: The batch job ID
+
+        Returns:
+            JSONL content as bytes (may be empty if no errors)
+        """
+        return await self._client._request_raw("GET", f"/v1/batches/{batch_id}/errors")
+
+    async def download_results_to(self, batch_id: str, file: str | Path | BinaryIO) -> None:
+        """Stream batch job results as JSONL into a file.
+
+        Unlike `download_results`, the body is never held in memory as a whole.
+
+        Args:
+            batch_id: The batch job ID
+            file: Path to write to or writable binary file-like object
+        """
+        await self._download_to(f"/v1/batches/{batch_id}/results", file)
+
+    async def download_errors_to(self, batch_id: str, file: str | Path | BinaryIO) -> None:
+        """Stream batch job errors as JSONL into a file.
+
+        Args:
+            batch_id: The batch job ID
+            file: Path to write to or writable binary file-like object
+        """
+        await self._download_to(f"/v1/batches/{batch_id}/errors", file)
+
+    async def _download_to(self, path: str, file: str | Path | BinaryIO) -> None:
+        """Internal method to stream a download into a path or file object."""
+        if isinstance(file, (str, Path)):
+            with open(file, "wb") as f:
+                await self._client._stream("GET", path, f)
+        else:
+            await self._client._stream("GET", path, file)
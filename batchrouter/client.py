@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import io
 import os
-from typing import Any
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cached_property
+from importlib.util import find_spec
+from typing import Any, BinaryIO
 
 import httpx
 
+from batchrouter._json import dumps, loads
 from batchrouter.batches import Batches
 from batchrouter.datasets import Datasets
 from batchrouter.exceptions import (
@@ -20,9 +28,174 @@ from batchrouter.models import Models
 
 DEFAULT_BASE_URL = "https://api.batchrouter.ai"
 DEFAULT_TIMEOUT = 60.0
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_MAX = 30.0
+USER_AGENT = "batchrouter-python/0.1.0"
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+DEFAULT_TRANSPORT_RETRIES = 2
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Responses worth retrying: rate limiting and gateway errors
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Methods that are safe to resend when the server may already have acted on them.
+# Other methods (creating batches, uploading) are only retried on 429.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Exceptions for specific error statuses; other 5xx raise ServerError
+_STATUS_ERRORS: dict[int, type[BatchRouterError]] = {
+    401: AuthenticationError,
+    404: NotFoundError,
+    422: ValidationError,
+}
+
+# HTTP/2 needs the optional "h2" package (pip install "batchrouter[http2]")
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+class _BaseClient:
+    """Configuration, authentication and error handling shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        retry_max: float = DEFAULT_RETRY_MAX,
+    ):
+        self._api_key = api_key or os.environ.get("BATCHROUTER_API_KEY")
+        if not self._api_key:
+            raise AuthenticationError(
+                "API key is required. Pass api_key parameter or set BATCHROUTER_API_KEY env var."
+            )
+
+        if not self._api_key.startswith("br_"):
+            raise AuthenticationError("Invalid API key format. API keys should start with 'br_'.")
+
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._retry_max = retry_max
+
+        # Responses for rarely changing endpoints (the model catalogue), keyed by path
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._cache_ttl = cache_ttl
+        # Dataset name -> ID, learned from listings to speed up get_by_name()
+        self._dataset_ids: dict[str, str] = {}
+
+        # Request headers are static for the client's lifetime, so build them once.
+        # Multipart uploads omit Content-Type so httpx can set the boundary.
+        # Accept-Encoding is left to httpx, which advertises every compression it
+        # can decode (gzip and deflate, plus br/zstd when their packages are installed).
+        self._headers_multipart = {
+            "Authorization": f"Bearer {self._api_key}",
+            "User-Agent": USER_AGENT,
+        }
+        self._headers_json = {**self._headers_multipart, "Content-Type": "application/json"}
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses so the next calls hit the API."""
+        self._cache.clear()
+        self._dataset_ids.clear()
+
+    def _forget_dataset(self, dataset_id: str) -> None:
+        """Remove a dataset from the name -> ID map."""
+        for name in [n for n, i in self._dataset_ids.items() if i == dataset_id]:
+            del self._dataset_ids[name]
+
+    def _cache_get(self, path: str) -> tuple[bool, Any]:
+        """Look up a cached response that is still within the TTL."""
+        hit = self._cache.get(path)
+        if hit is not None and time.monotonic() - hit[0] < self._cache_ttl:
+            return True, hit[1]
+        return False, None
+
+    def _cache_set(self, path: str, response: Any) -> None:
+        """Cache a response for path."""
+        self._cache[path] = (time.monotonic(), response)
+
+    def _should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        replayable: bool = True,
+    ) -> bool:
+        """Decide whether to retry a request.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries already made
+            response: The response received, or None after a transport error
+            replayable: Whether the request body can be sent again
+        """
+        if attempt >= self._max_retries or not replayable:
+            return False
+        if response is None:
+            return method in _IDEMPOTENT_METHODS
+        if response.status_code not in RETRY_STATUS_CODES:
+            return False
+        return response.status_code == 429 or method in _IDEMPOTENT_METHODS
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait before the next retry.
+
+        Honours a numeric Retry-After header, otherwise backs off exponentially
+        with jitter. Both are capped at retry_max.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return min(self._retry_max, max(0.0, float(retry_after)))
+                except ValueError:
+                    pass
+
+        delay = min(self._retry_max, self._retry_backoff * 2.0**attempt)
+        return delay * (0.5 + random.random() * 0.5)
+
+    @staticmethod
+    def _is_replayable(files: dict[str, Any] | None) -> bool:
+        """Whether upload bodies can be re-read for a retry.
+
+        httpx rewinds file objects before sending them, which only works for
+        seekable files.
+        """
+        if not files:
+            return True
+        for value in files.values():
+            file = value[1] if isinstance(value, tuple) else value
+            if hasattr(file, "read") and not (hasattr(file, "seekable") and file.seekable()):
+                return False
+        return True
+
+    def _handle_error(self, response: httpx.Response) -> None:
+        """Handle error responses from the API."""
+        status_code = response.status_code
+        try:
+            error_data = loads(response.content)
+            message = error_data.get("detail", str(error_data))
+        except Exception:
+            message = response.text or f"HTTP {status_code}"
+
+        error_class = _STATUS_ERRORS.get(status_code)
+        if error_class is not None:
+            raise error_class(message)
+        if status_code >= 500:
+            raise ServerError(message)
+        raise BatchRouterError(message, status_code=status_code)
 
 
-class BatchRouter:
+class BatchRouter(_BaseClient):
     """BatchRouter API client.
 
     Args:
@@ -30,6 +203,12 @@ class BatchRouter:
             If not provided, will look for BATCHROUTER_API_KEY env var.
         base_url: API base URL. Defaults to https://api.batchrouter.ai
         timeout: Request timeout in seconds. Defaults to 60.
+        cache_ttl: Seconds to reuse model catalogue responses. Defaults to 300;
+            0 disables caching.
+        max_retries: Retries for rate-limited (429), gateway error (502/503/504)
+            and failed connection attempts. Defaults to 3; 0 disables retries.
+        retry_backoff: Base delay in seconds for exponential backoff. Defaults to 0.5.
+        retry_max: Maximum delay in seconds between retries. Defaults to 30.
 
     Example:
         ```python
@@ -60,51 +239,46 @@ class BatchRouter:
         api_key: str | None = None,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        retry_max: float = DEFAULT_RETRY_MAX,
     ):
-        self._api_key = api_key or os.environ.get("BATCHROUTER_API_KEY")
-        if not self._api_key:
-            raise AuthenticationError(
-                "API key is required. Pass api_key parameter or set BATCHROUTER_API_KEY env var."
-            )
-
-        if not self._api_key.startswith("br_"):
-            raise AuthenticationError("Invalid API key format. API keys should start with 'br_'.")
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            retry_max=retry_max,
+        )
+        # Paths are joined onto this base by httpx, which parses it only once
+        self._client = httpx.Client(
+            base_url=f"{self._base_url}/api",
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=DEFAULT_LIMITS,
+                retries=DEFAULT_TRANSPORT_RETRIES,
+            ),
+        )
 
-        self._base_url = base_url.rstrip("/")
-        self._timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
+    # Resource classes are created on first access
+    @cached_property
+    def datasets(self) -> Datasets:
+        """Dataset operations."""
+        return Datasets(self)
 
-        # Initialize resource classes
-        self.datasets = Datasets(self)
-        self.batches = Batches(self)
-        self.models = Models(self)
+    @cached_property
+    def batches(self) -> Batches:
+        """Batch job operations."""
+        return Batches(self)
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers with authentication."""
-        return {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "batchrouter-python/0.1.0",
-        }
-
-    def _handle_error(self, response: httpx.Response) -> None:
-        """Handle error responses from the API."""
-        try:
-            error_data = response.json()
-            message = error_data.get("detail", str(error_data))
-        except Exception:
-            message = response.text or f"HTTP {response.status_code}"
-
-        if response.status_code == 401:
-            raise AuthenticationError(message)
-        elif response.status_code == 404:
-            raise NotFoundError(message)
-        elif response.status_code == 422:
-            raise ValidationError(message)
-        elif response.status_code >= 500:
-            raise ServerError(message)
-        else:
-            raise BatchRouterError(message, status_code=response.status_code)
+    @cached_property
+    def models(self) -> Models:
+        """Model listing and information."""
+        return Models(self)
 
     def _request(
         self,
@@ -116,42 +290,120 @@ class BatchRouter:
         files: dict[str, Any] | None = None,
     ) -> Any:
         """Make an API request and return JSON response."""
-        url = f"{self._base_url}/api{path}"
-        headers = self._get_headers()
+        headers = self._headers_multipart if files else self._headers_json
 
-        # Don't send Content-Type for multipart file uploads
-        if files:
-            del headers["Content-Type"]
-
-        response = self._client.request(
+        response = self._send(
             method,
-            url,
+            path,
+            replayable=self._is_replayable(files),
             headers=headers,
             params=params,
-            json=json,
+            content=None if json is None else dumps(json),
             data=data,
             files=files,
         )
 
-        if not response.is_success:
+        status_code = response.status_code
+        if status_code >= 300:
             self._handle_error(response)
 
-        if response.status_code == 204:
+        if status_code == 204:
             return None
 
-        return response.json()
+        return loads(response.content)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        replayable: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures."""
+        attempt = 0
+        while True:
+            try:
+                response = self._client.request(method, path, **kwargs)
+            except httpx.TransportError:
+                if not self._should_retry(method, attempt, replayable=replayable):
+                    raise
+                delay = self._retry_delay(attempt)
+            else:
+                if not self._should_retry(method, attempt, response, replayable):
+                    return response
+                response.close()
+                delay = self._retry_delay(attempt, response)
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _cached_request(self, path: str) -> Any:
+        """Make a GET request, reusing a cached response within the TTL."""
+        hit, response = self._cache_get(path)
+        if hit:
+            return response
+
+        response = self._request("GET", path)
+        self._cache_set(path, response)
+        return response
 
     def _request_raw(self, method: str, path: str) -> bytes:
         """Make an API request and return raw bytes (for file downloads)."""
-        url = f"{self._base_url}/api{path}"
-        headers = self._get_headers()
-
-        response = self._client.request(method, url, headers=headers)
+        buffer = io.BytesIO()
+        self._stream(method, path, buffer)
+        return buffer.getvalue()
 
-        if not response.is_success:
-            self._handle_error(response)
-
-        return response.content
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        sink: BinaryIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Make an API request and write the response body to sink chunk by chunk."""
+        with self._open_stream(method, path) as response:
+            for chunk in response.iter_bytes(chunk_size):
+                sink.write(chunk)
+
+    @contextmanager
+    def _open_stream(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[httpx.Response]:
+        """Open a streamed API response with a successful status.
+
+        Transient failures are retried until the body is handed to the caller.
+        """
+        if headers is None:
+            headers = self._headers_json
+
+        attempt = 0
+        while True:
+            body_started = False
+            try:
+                with self._client.stream(method, path, headers=headers, **kwargs) as response:
+                    if not self._should_retry(method, attempt, response):
+                        if response.status_code >= 300:
+                            response.read()
+                            self._handle_error(response)
+
+                        # Data the caller already consumed can't be taken back, so
+                        # failures past this point are not retried
+                        body_started = True
+                        yield response
+                        return
+
+                    delay = self._retry_delay(attempt, response)
+            except httpx.TransportError:
+                if body_started or not self._should_retry(method, attempt):
+                    raise
+                delay = self._retry_delay(attempt)
+
+            time.sleep(delay)
+            attempt += 1
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO
 
+from batchrouter.exceptions import NotFoundError
 from batchrouter.types import Dataset, DatasetUploadResponse
 
 if TYPE_CHECKING:
+    from batchrouter.async_client import AsyncBatchRouter
     from batchrouter.client import BatchRouter
 
+# Page size used when scanning datasets for a name
+_NAME_LOOKUP_PAGE_SIZE = 100
+DEFAULT_UPLOAD_CONCURRENCY = 8
+
 
 class Datasets:
     """Dataset operations."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: "BatchRouter"):
         self._client = client
 
@@ -44,6 +55,30 @@ class Datasets:
                 raise ValueError("name is required when uploading from file-like object")
             return self._upload_file(file, name, description)
 
+    def upload_many(
+        self,
+        files: Iterable[str | Path],
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> list[DatasetUploadResponse]:
+        """Upload several datasets concurrently.
+
+        Each dataset is named after its file, as with `upload`.
+
+        Args:
+            files: Paths to JSONL files
+            concurrency: Maximum number of uploads in flight at once
+
+        Returns:
+            DatasetUploadResponse objects in the same order as files
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self.upload, files))
+
     def _upload_file(
         self,
         file: BinaryIO,
@@ -52,9 +87,8 @@ class Datasets:
     ) -> DatasetUploadResponse:
         """Internal method to upload a file."""
         files = {"file": (name, file, "application/jsonl")}
-        data = {"name": name}
-        if description:
-            data["description"] = description
+        fields = (("name", name), ("description", description))
+        data = {key: value for key, value in fields if value is not None}
 
         response = self._client._request(
             "POST",
@@ -62,7 +96,7 @@ class Datasets:
             files=files,
             data=data,
         )
-        return DatasetUploadResponse(**response)
+        return DatasetUploadResponse._from_dict(response)
 
     def list(self, page: int = 1, page_size: int = 20) -> list[Dataset]:
         """List all datasets.
@@ -79,7 +113,9 @@ class Datasets:
             "/v1/datasets",
             params={"page": page, "page_size": page_size},
         )
-        return [Dataset(**d) for d in response.get("data", [])]
+        datasets = [Dataset._from_dict(d) for d in response.get("data", [])]
+        self._client._dataset_ids.update((d.name, d.id) for d in datasets)
+        return datasets
 
     def get(self, dataset_id: str) -> Dataset:
         """Get a dataset by ID.
@@ -91,22 +127,47 @@ class Datasets:
             Dataset object
         """
         response = self._client._request("GET", f"/v1/datasets/{dataset_id}")
-        return Dataset(**response)
+        return Dataset._from_dict(response)
 
     def get_by_name(self, name: str) -> Dataset | None:
         """Get a dataset by name.
 
+        Names seen in earlier listings are resolved with a single lookup by ID;
+        otherwise all pages are scanned until the name is found.
+
         Args:
             name: The dataset name
 
         Returns:
             Dataset object or None if not found
         """
-        datasets = self.list(page_size=100)
-        for dataset in datasets:
-            if dataset.name == name:
-                return dataset
-        return None
+        dataset_id = self._client._dataset_ids.get(name)
+        if dataset_id is not None:
+            try:
+                dataset = self.get(dataset_id)
+            except NotFoundError:
+                pass
+            else:
+                if dataset.name == name:
+                    return dataset
+            # Deleted or renamed since it was cached
+            self._client._dataset_ids.pop(name, None)
+
+        page = 1
+        while True:
+            response = self._client._request(
+                "GET",
+                "/v1/datasets",
+                params={"page": page, "page_size": _NAME_LOOKUP_PAGE_SIZE},
+            )
+            for d in response.get("data", []):
+                dataset = Dataset._from_dict(d)
+                self._client._dataset_ids[dataset.name] = dataset.id
+                if dataset.name == name:
+                    return dataset
+            if not response.get("has_more"):
+                return None
+            page += 1
 
     def delete(self, dataset_id: str) -> None:
         """Delete a dataset.
@@ -115,3 +176,168 @@ class Datasets:
             dataset_id: The dataset ID to delete
         """
         self._client._request("DELETE", f"/v1/datasets/{dataset_id}")
+        self._client._forget_dataset(dataset_id)
+
+
+class AsyncDatasets:
+    """Async dataset operations."""
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: "AsyncBatchRouter"):
+        self._client = client
+
+    async def upload(
+        self,
+        file: str | Path | BinaryIO,
+        name: str | None = None,
+        description: str | None = None,
+    ) -> DatasetUploadResponse:
+        """Upload a new dataset.
+
+        Args:
+            file: Path to JSONL file or file-like object
+            name: Optional name for the dataset (defaults to filename)
+            description: Optional description
+
+        Returns:
+            DatasetUploadResponse with id, name, and status
+        """
+        if isinstance(file, (str, Path)):
+            file_path = Path(file)
+            if name is None:
+                name = file_path.name
+            with open(file_path, "rb") as f:
+                return await self._upload_file(f, name, description)
+        else:
+            if name is None:
+                raise ValueError("name is required when uploading from file-like object")
+            return await self._upload_file(file, name, description)
+
+    async def upload_many(
+        self,
+        files: Iterable[str | Path],
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> list[DatasetUploadResponse]:
+        """Upload several datasets concurrently.
+
+        Each dataset is named after its file, as with `upload`.
+
+        Args:
+            files: Paths to JSONL files
+            concurrency: Maximum number of uploads in flight at once
+
+        Returns:
+            DatasetUploadResponse objects in the same order as files
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload_one(file: str | Path) -> DatasetUploadResponse:
+            async with semaphore:
+                return await self.upload(file)
+
+        return list(await asyncio.gather(*[upload_one(f) for f in files]))
+
+    async def _upload_file(
+        self,
+        file: BinaryIO,
+        name: str,
+        description: str | None,
+    ) -> DatasetUploadResponse:
+        """Internal method to upload a file."""
+        files = {"file": (name, file, "application/jsonl")}
+        fields = (("name", name), ("description", description))
+        data = {key: value for key, value in fields if value is not None}
+
+        response = await self._client._request(
+            "POST",
+            "/v1/datasets",
+            files=files,
+            data=data,
+        )
+        return DatasetUploadResponse._from_dict(response)
+
+    async def list(self, page: int = 1, page_size: int = 20) -> list[Dataset]:
+        """List all datasets.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+
+        Returns:
+            List of Dataset objects
+        """
+        response = await self._client._request(
+            "GET",
+            "/v1/datasets",
+            params={"page": page, "page_size": page_size},
+        )
+        datasets = [Dataset._from_dict(d) for d in response.get("data", [])]
+        self._client._dataset_ids.update((d.name, d.id) for d in datasets)
+        return datasets
+
+    async def get(self, dataset_id: str) -> Dataset:
+        """Get a dataset by ID.
+
+        Args:
+            dataset_id: The dataset ID
+
+        Returns:
+            Dataset object
+        """
+        response = await self._client._request("GET", f"/v1/datasets/{dataset_id}")
+        return Dataset._from_dict(response)
+
+    async def get_by_name(self, name: str) -> Dataset | None:
+        """Get a dataset by name.
+
+        Names seen in earlier listings are resolved with a single lookup by ID;
+        otherwise all pages are scanned until the name is found.
+
+        Args:
+            name: The dataset name
+
+        Returns:
+            Dataset object or None if not found
+        """
+        dataset_id = self._client._dataset_ids.get(name)
+        if dataset_id is not None:
+            try:
+                dataset = await self.get(dataset_id)
+            except NotFoundError:
+                pass
+            else:
+                if dataset.name == name:
+                    return dataset
+            # Deleted or renamed since it was cached
+            self._client._dataset_ids.pop(name, None)
+
+        page = 1
+        while True:
+            response = await self._client._request(
+                "GET",
+                "/v1/datasets",
+                params={"page": page, "page_size": _NAME_LOOKUP_PAGE_SIZE},
+            )
+            for d in response.get("data", []):
+                dataset = Dataset._from_dict(d)
+                self._client._dataset_ids[dataset.name] = dataset.id
+                if dataset.name == name:
+                    return dataset
+            if not response.get("has_more"):
+                return None
+            page += 1
+
+    async def delete(self, dataset_id: str) -> None:
+        """Delete a dataset.
+
+        Args:
+            dataset_id: The dataset ID to delete
+        """
+        await self._client._request("DELETE", f"/v1/datasets/{dataset_id}")
+        self._client._forget_dataset(dataset_id)
@@ -1,18 +1,32 @@
 """Exception classes for BatchRouter SDK."""
 
+from typing import Any
+
 
 class BatchRouterError(Exception):
     """Base exception for all BatchRouter errors."""
 
+    __slots__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int | None = None):
         super().__init__(message)
-        self.message = message
         self.status_code = status_code
 
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return self.args[0] if self.args else ""
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slots aren't part of the default pickled state
+        return type(self), self.args, {"status_code": self.status_code}
+
 
 class AuthenticationError(BatchRouterError):
     """Raised when API key is invalid or missing."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Invalid or missing API key"):
         super().__init__(message, status_code=401)
 
@@ -20,6 +34,8 @@ class AuthenticationError(BatchRouterError):
 class NotFoundError(BatchRouterError):
     """Raised when a requested resource is not found."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource not found"):
         super().__init__(message, status_code=404)
 
@@ -27,6 +43,8 @@ class NotFoundError(BatchRouterError):
 class ValidationError(BatchRouterError):
     """Raised when request validation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Validation failed"):
         super().__init__(message, status_code=422)
 
@@ -34,5 +52,7 @@ class ValidationError(BatchRouterError):
 class ServerError(BatchRouterError):
     """Raised when the server returns an error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Server error"):
         super().__init__(message, status_code=500)
@@ -7,23 +7,28 @@ from typing import TYPE_CHECKING
 from batchrouter.types import Model
 
 if TYPE_CHECKING:
+    from batchrouter.async_client import AsyncBatchRouter
     from batchrouter.client import BatchRouter
 
 
 class Models:
     """Model listing and information."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: "BatchRouter"):
         self._client = client
 
     def list(self) -> list[Model]:
         """List all available models.
 
+        The catalogue is cached on the client for `cache_ttl` seconds.
+
         Returns:
             List of Model objects with provider information
         """
-        response = self._client._request("GET", "/v1/routing/models")
-        return [Model(**m) for m in response]
+        response = self._client._cached_request("/v1/routing/models")
+        return [Model._from_dict(m) for m in response]
 
     def get(self, name: str) -> Model | None:
         """Get a model by name.
@@ -34,7 +39,41 @@ class Models:
         Returns:
             Model object or None if not found
         """
-        response = self._client._request("GET", f"/v1/routing/models/{name}")
+        response = self._client._cached_request(f"/v1/routing/models/{name}")
+        if response:
+            return Model._from_dict(response)
+        return None
+
+
+class AsyncModels:
+    """Async model listing and information."""
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: "AsyncBatchRouter"):
+        self._client = client
+
+    async def list(self) -> list[Model]:
+        """List all available models.
+
+        The catalogue is cached on the client for `cache_ttl` seconds.
+
+        Returns:
+            List of Model objects with provider information
+        """
+        response = await self._client._cached_request("/v1/routing/models")
+        return [Model._from_dict(m) for m in response]
+
+    async def get(self, name: str) -> Model | None:
+        """Get a model by name.
+
+        Args:
+            name: Model name (e.g., "gpt-4o", "claude-3.5-sonnet")
+
+        Returns:
+            Model object or None if not found
+        """
+        response = await self._client._cached_request(f"/v1/routing/models/{name}")
         if response:
-            return Model(**response)
+            return Model._from_dict(response)
         return None
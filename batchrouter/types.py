@@ -1,12 +1,89 @@
 """Type definitions for BatchRouter SDK."""
 
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
-from pydantic import BaseModel
+_T = TypeVar("_T", bound="_Payload")
 
 
-class Dataset(BaseModel):
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as returned by the API."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class _Payload:
+    """Base class for types built from API responses.
+
+    Responses come from a trusted server, so they are mapped onto plain
+    dataclasses without validation. Timestamps are kept as the raw strings
+    and only parsed when their *_dt property is first read.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _from_dict(cls: type[_T], data: dict[str, Any]) -> _T:
+        """Build an instance from a response payload, ignoring unknown keys.
+
+        The types defined below get a generated replacement from
+        `_compile_from_dict`; this generic version serves any other subclass.
+        """
+        fields = cls.__dataclass_fields__  # type: ignore[attr-defined]
+        return cls(**{key: data[key] for key in fields.keys() & data.keys() if fields[key].init})
+
+
+class _Timestamped(_Payload):
+    """Base class for types with timestamp fields.
+
+    Parsed timestamps are memoized in a plain slot rather than a dataclass
+    field, so they stay out of `fields()`, `asdict()`, repr and comparisons.
+    """
+
+    __slots__ = ("_parsed_timestamps",)
+
+    _parsed_timestamps: dict[str, datetime]
+
+    def _timestamp(self, name: str, value: str) -> datetime:
+        """Return the timestamp field called name, parsing value on first access."""
+        try:
+            parsed = self._parsed_timestamps
+        except AttributeError:
+            parsed = self._parsed_timestamps = {}
+        if name not in parsed:
+            parsed[name] = _parse_datetime(value)
+        return parsed[name]
+
+
+def _compile_from_dict(cls: type[_Payload]) -> None:
+    """Install a `_from_dict` on cls that reads each of its fields by name.
+
+    The generated function passes every init field as a literal keyword
+    argument, which is faster than filtering the payload and unpacking it
+    with **. Omitted fields get the same defaults the dataclass would use;
+    a missing required field raises KeyError.
+    """
+    namespace: dict[str, Any] = {}
+    args = []
+    for f in fields(cls):  # type: ignore[arg-type]
+        if not f.init:
+            continue
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            args.append(f"{f.name}=data.get({f.name!r}, _default_{f.name})")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            args.append(f"{f.name}=data[{f.name!r}] if {f.name!r} in data else _factory_{f.name}()")
+        else:
+            args.append(f"{f.name}=data[{f.name!r}]")
+
+    source = f"def _from_dict(cls, data):\n    return cls({', '.join(args)})\n"
+    exec(source, namespace)
+    setattr(cls, "_from_dict", classmethod(namespace["_from_dict"]))
+
+
+@dataclass(slots=True, kw_only=True)
+class Dataset(_Timestamped):
     """A dataset containing JSONL data for batch processing."""
 
     id: str
@@ -16,11 +93,24 @@ class Dataset(BaseModel):
     record_count: int | None = None
     status: str
     validation_error: str | None = None
-    created_at: datetime
-    updated_at: datetime | None = None
+    created_at: str
+    updated_at: str | None = None
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """`created_at` parsed as a datetime (parsed on first access)."""
+        return self._timestamp("created_at", self.created_at)
 
+    @property
+    def updated_at_dt(self) -> datetime | None:
+        """`updated_at` parsed as a datetime (parsed on first access)."""
+        if not self.updated_at:
+            return None
+        return self._timestamp("updated_at", self.updated_at)
 
-class DatasetUploadResponse(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class DatasetUploadResponse(_Payload):
     """Response when uploading a new dataset."""
 
     id: str
@@ -28,7 +118,8 @@ class DatasetUploadResponse(BaseModel):
     status: str
 
 
-class ModelProvider(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ModelProvider(_Payload):
     """A provider offering a specific model."""
 
     id: str
@@ -38,7 +129,8 @@ class ModelProvider(BaseModel):
     is_batch_supported: bool = True
 
 
-class Model(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Model(_Payload):
     """An LLM model available for batch processing."""
 
     name: str
@@ -46,13 +138,22 @@ class Model(BaseModel):
     description: str | None = None
     context_window: int | None = None
     max_output_tokens: int | None = None
-    capabilities: list[str] = []
+    capabilities: list[str] = field(default_factory=list)
     is_deprecated: bool = False
     release_date: str | None = None
-    providers: list[ModelProvider] = []
+    providers: list[ModelProvider] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # The payload may be a cached response shared with later calls, so
+        # mutable fields are copied rather than referenced
+        self.capabilities = list(self.capabilities)
+        self.providers = [
+            ModelProvider._from_dict(p) if isinstance(p, dict) else p for p in self.providers
+        ]
 
 
-class BatchJob(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class BatchJob(_Timestamped):
     """A batch job for processing LLM requests."""
 
     id: str
@@ -73,12 +174,32 @@ class BatchJob(BaseModel):
     actual_cost: float | None = None
     has_results: bool = False
     has_errors: bool = False
-    created_at: datetime
-    submitted_at: datetime | None = None
-    completed_at: datetime | None = None
-
-
-class BatchCreateRequest(BaseModel):
+    created_at: str
+    submitted_at: str | None = None
+    completed_at: str | None = None
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """`created_at` parsed as a datetime (parsed on first access)."""
+        return self._timestamp("created_at", self.created_at)
+
+    @property
+    def submitted_at_dt(self) -> datetime | None:
+        """`submitted_at` parsed as a datetime (parsed on first access)."""
+        if not self.submitted_at:
+            return None
+        return self._timestamp("submitted_at", self.submitted_at)
+
+    @property
+    def completed_at_dt(self) -> datetime | None:
+        """`completed_at` parsed as a datetime (parsed on first access)."""
+        if not self.completed_at:
+            return None
+        return self._timestamp("completed_at", self.completed_at)
+
+
+@dataclass(slots=True, kw_only=True)
+class BatchCreateRequest(_Payload):
     """Request to create a new batch job."""
 
     dataset_name: str
@@ -87,7 +208,8 @@ class BatchCreateRequest(BaseModel):
     description: str | None = None
 
 
-class BatchCreateResponse(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class BatchCreateResponse(_Payload):
     """Response when creating a new batch job."""
 
     id: str
@@ -98,7 +220,8 @@ class BatchCreateResponse(BaseModel):
     estimated_cost: float | None = None
 
 
-class PaginatedResponse(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PaginatedResponse(_Payload):
     """Paginated response wrapper."""
 
     data: list[Any]
@@ -106,3 +229,17 @@ class PaginatedResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool
+
+
+for _cls in (
+    Dataset,
+    DatasetUploadResponse,
+    ModelProvider,
+    Model,
+    BatchJob,
+    BatchCreateRequest,
+    BatchCreateResponse,
+    PaginatedResponse,
+):
+    _compile_from_dict(_cls)
+del _cls
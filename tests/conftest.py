@@ -1,8 +1,11 @@
 """Pytest fixtures for BatchRouter SDK tests."""
 
 import pytest
-import httpx
-from unittest.mock import MagicMock, patch
+import respx
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from batchrouter import BatchRouter
+from batchrouter.client import DEFAULT_BASE_URL
 
 
 @pytest.fixture
@@ -14,6 +17,62 @@ def mock_client():
         yield client_instance
 
 
+@pytest.fixture
+def mock_async_client():
+    """Create a mock httpx async client."""
+    with patch("httpx.AsyncClient") as mock:
+        client_instance = MagicMock()
+        client_instance.request = AsyncMock()
+        client_instance.aclose = AsyncMock()
+        mock.return_value = client_instance
+        yield client_instance
+
+
+@pytest.fixture(scope="session")
+def respx_router():
+    """Intercept httpx transports for the rest of the session."""
+    with respx.mock(base_url=f"{DEFAULT_BASE_URL}/api", assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def respx_mock(respx_router):
+    """The session router, with routes and calls cleared after each test."""
+    yield respx_router
+    respx_router.clear()
+    respx_router.reset()
+
+
+@pytest.fixture(scope="module")
+def client(respx_router):
+    """A client shared by the tests of a module, answered by respx routes."""
+    client = BatchRouter(api_key="br_test_key_123", max_retries=0)
+    yield client
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_client(request):
+    """Drop cached state so tests sharing a client stay independent."""
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client").invalidate_cache()
+
+
+@pytest.fixture
+def mock_request(client):
+    """Patch the client's _request (an AsyncMock for async clients)."""
+    with patch.object(client, "_request") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="session")
+def sample_jsonl(tmp_path_factory):
+    """A small JSONL dataset on disk, written once per session."""
+    path = tmp_path_factory.mktemp("data") / "test.jsonl"
+    path.write_text('{"custom_id": "1", "messages": [{"role": "user", "content": "Hi"}]}')
+    return path
+
+
 @pytest.fixture
 def api_key():
     """Test API key."""
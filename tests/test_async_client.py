@@ -0,0 +1,363 @@
+"""Tests for the async BatchRouter client."""
+
+import asyncio
+import io
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from batchrouter import (
+    AsyncBatchRouter,
+    BatchCreateResponse,
+    BatchJob,
+    Dataset,
+    DatasetUploadResponse,
+    Model,
+)
+from batchrouter.exceptions import AuthenticationError, NotFoundError
+
+
+def _job(status: str, batch_id: str = "batch_123") -> dict:
+    """Build a batch job payload with the given status."""
+    return {
+        "id": batch_id,
+        "dataset_id": "ds_123",
+        "model": "gpt-4o",
+        "status": status,
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+class _DroppedEvents(httpx.AsyncByteStream):
+    """An event stream whose connection drops after the first event."""
+
+    async def __aiter__(self):
+        yield f"data: {json.dumps(_job('processing'))}\n\n".encode()
+        raise httpx.ReadError("Connection reset")
+
+
+class TestAsyncClient:
+    """Test async client initialization and requests."""
+
+    def test_init_with_api_key(self, mock_async_client):
+        """Test initialization with explicit API key."""
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+        assert client._api_key == "br_test_key_123"
+        assert client._base_url == "https://api.batchrouter.ai"
+        assert hasattr(client, "datasets")
+        assert hasattr(client, "batches")
+        assert hasattr(client, "models")
+
+    def test_init_with_invalid_key_format(self, mock_async_client):
+        """Test that invalid key format raises AuthenticationError."""
+        with pytest.raises(AuthenticationError):
+            AsyncBatchRouter(api_key="invalid_key_without_prefix")
+
+    @pytest.mark.asyncio
+    async def test_context_manager(self, mock_async_client):
+        """Test client works as async context manager."""
+        async with AsyncBatchRouter(api_key="br_test_key_123") as client:
+            assert client._api_key == "br_test_key_123"
+        mock_async_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_request(self, respx_mock):
+        """Test that requests are sent with auth headers and decoded."""
+        route = respx_mock.get("/v1/test").mock(return_value=httpx.Response(200, json={"ok": True}))
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        result = await client._request("GET", "/v1/test", params={"page": 1})
+
+        assert result == {"ok": True}
+        request = route.calls.last.request
+        assert request.headers["Authorization"] == "Bearer br_test_key_123"
+        assert request.url.params == httpx.QueryParams(page=1)
+
+    @pytest.mark.asyncio
+    async def test_request_error(self, respx_mock):
+        """Test that error responses raise the mapped exception."""
+        respx_mock.get("/v1/batches/nonexistent").mock(
+            return_value=httpx.Response(404, json={"detail": "Batch not found"})
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await client._request("GET", "/v1/batches/nonexistent")
+
+        assert "Batch not found" in exc_info.value.message
+
+    @pytest.mark.asyncio
+    async def test_request_retries_transient_errors(self, respx_mock):
+        """Test that transient responses are retried with asyncio.sleep."""
+        route = respx_mock.get("/v1/batches").mock(
+            side_effect=[
+                httpx.Response(503, json={"detail": "Unavailable"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        with patch("batchrouter.async_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client._request("GET", "/v1/batches")
+
+        assert result == {"ok": True}
+        assert route.call_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_request_raw(self, respx_mock):
+        """Test raw requests stream and collect the response body."""
+        respx_mock.get("/v1/batches/batch_123/results").mock(
+            return_value=httpx.Response(200, content=b'{"custom_id": "1"}\n{"custom_id": "2"}\n')
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        result = await client._request_raw("GET", "/v1/batches/batch_123/results")
+
+        assert result == b'{"custom_id": "1"}\n{"custom_id": "2"}\n'
+
+    @pytest.mark.asyncio
+    async def test_stream_error(self, respx_mock):
+        """Test that streamed error responses are read and mapped."""
+        respx_mock.get("/v1/batches/nonexistent/results").mock(
+            return_value=httpx.Response(404, json={"detail": "Batch not found"})
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        with pytest.raises(NotFoundError) as exc_info:
+            await client._stream("GET", "/v1/batches/nonexistent/results", io.BytesIO())
+
+        assert exc_info.value.message == "Batch not found"
+
+
+class TestAsyncResources:
+    """Test async resource operations."""
+
+    @pytest.fixture
+    def client(self, mock_async_client):
+        """Create a client with mocked HTTP."""
+        return AsyncBatchRouter(api_key="br_test_key_123")
+
+    @pytest.mark.asyncio
+    async def test_create_batch(self, client, mock_request):
+        """Test creating a batch."""
+        mock_request.return_value = {
+            "id": "batch_123",
+            "status": "pending",
+            "model": "gpt-4o",
+        }
+
+        result = await client.batches.create(dataset_name="my-dataset", provider="openai")
+
+        assert isinstance(result, BatchCreateResponse)
+        assert result.id == "batch_123"
+        mock_request.assert_awaited_once_with(
+            "POST",
+            "/v1/batches",
+            json={"dataset_name": "my-dataset", "model": "auto", "provider": "openai"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_batches_concurrently(self, client, mock_request):
+        """Test fanning out batch lookups with asyncio.gather."""
+
+        async def fake_request(method, path):
+            return _job("processing", batch_id=path.rsplit("/", 1)[-1])
+
+        mock_request.side_effect = fake_request
+
+        result = await asyncio.gather(*[client.batches.get(f"batch_{i}") for i in range(3)])
+
+        assert all(isinstance(b, BatchJob) for b in result)
+        assert [b.id for b in result] == ["batch_0", "batch_1", "batch_2"]
+
+    @pytest.mark.asyncio
+    async def test_wait(self, client, mock_request):
+        """Test waiting for a batch job with asyncio.sleep."""
+        with patch("batchrouter.batches.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_request.side_effect = [_job("processing"), _job("completed")]
+
+            result = await client.batches.wait("batch_123", poll_interval=1.0)
+
+            assert result.status == "completed"
+            mock_sleep.assert_awaited_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_download_results(self, client):
+        """Test downloading batch results."""
+        with patch.object(client, "_request_raw", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = b'{"custom_id": "1"}\n'
+
+            result = await client.batches.download_results("batch_123")
+
+            assert result == b'{"custom_id": "1"}\n'
+            mock_request.assert_awaited_once_with("GET", "/v1/batches/batch_123/results")
+
+    @pytest.mark.asyncio
+    async def test_download_results_to(self, client):
+        """Test streaming batch results into a file-like object."""
+        with patch.object(client, "_stream", new_callable=AsyncMock) as mock_stream:
+            sink = io.BytesIO()
+
+            await client.batches.download_results_to("batch_123", sink)
+
+            mock_stream.assert_awaited_once_with("GET", "/v1/batches/batch_123/results", sink)
+
+    @pytest.mark.asyncio
+    async def test_upload_dataset(self, client, mock_request):
+        """Test uploading a dataset from a file-like object."""
+        file_obj = io.BytesIO(b'{"custom_id": "1", "messages": []}')
+
+        mock_request.return_value = {"id": "ds_123", "name": "my-data", "status": "pending"}
+
+        result = await client.datasets.upload(file_obj, name="my-data")
+
+        assert isinstance(result, DatasetUploadResponse)
+        assert result.id == "ds_123"
+        assert mock_request.call_args[1]["data"] == {"name": "my-data"}
+
+    @pytest.mark.asyncio
+    async def test_upload_many(self, client, tmp_path, mock_request):
+        """Test concurrent uploads are bounded and keep input order."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"part-{i}.jsonl"
+            path.write_text('{"custom_id": "1", "messages": []}')
+            paths.append(path)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_request(method, path, files, data):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"id": f"ds_{data['name']}", "name": data["name"], "status": "pending"}
+
+        mock_request.side_effect = fake_request
+
+        result = await client.datasets.upload_many(paths, concurrency=2)
+
+        assert [r.name for r in result] == [f"part-{i}.jsonl" for i in range(5)]
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_upload_many_requires_positive_concurrency(self, client, tmp_path):
+        """Test that upload_many rejects a concurrency below 1 instead of hanging."""
+        with pytest.raises(ValueError) as exc_info:
+            await asyncio.wait_for(
+                client.datasets.upload_many([tmp_path / "part-0.jsonl"], concurrency=0), 1.0
+            )
+        assert "concurrency must be at least 1" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_get_dataset_by_name(self, client, mock_request):
+        """Test getting a dataset by name."""
+        mock_request.return_value = {
+            "data": [
+                {
+                    "id": "ds_1",
+                    "name": "target-dataset",
+                    "status": "validated",
+                    "created_at": "2025-01-01T00:00:00Z",
+                },
+            ],
+        }
+
+        result = await client.datasets.get_by_name("target-dataset")
+
+        assert isinstance(result, Dataset)
+        assert result.id == "ds_1"
+
+    @pytest.mark.asyncio
+    async def test_list_models(self, client, mock_request):
+        """Test listing models."""
+        mock_request.return_value = [{"name": "gpt-4o", "providers": []}]
+
+        result = await client.models.list()
+
+        assert len(result) == 1
+        assert isinstance(result[0], Model)
+        mock_request.assert_awaited_once_with("GET", "/v1/routing/models")
+
+    @pytest.mark.asyncio
+    async def test_stream_status(self, respx_mock):
+        """Test streaming status updates as server-sent events."""
+        events = "".join(
+            f"data: {json.dumps(_job(status))}\n\n" for status in ("processing", "completed")
+        )
+        respx_mock.get("/v1/batches/batch_123/events").mock(
+            return_value=httpx.Response(200, text=events)
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        result = [job async for job in client.batches.stream_status("batch_123")]
+
+        assert [job.status for job in result] == ["processing", "completed"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [404, 503])
+    async def test_stream_status_falls_back_to_polling(self, respx_mock, status_code):
+        """Test that jobs are polled when the events endpoint is missing or failing."""
+        respx_mock.get("/v1/batches/batch_123/events").mock(
+            return_value=httpx.Response(status_code, json={"detail": "Unavailable"})
+        )
+        respx_mock.get("/v1/batches/batch_123").mock(
+            side_effect=[
+                httpx.Response(200, json=_job("pending")),
+                httpx.Response(200, json=_job("pending")),
+                httpx.Response(200, json=_job("completed")),
+            ]
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123", max_retries=0)
+
+        with patch("batchrouter.batches.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = [job async for job in client.batches.stream_status("batch_123")]
+
+        assert [job.status for job in result] == ["pending", "completed"]
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_status_polls_after_dropped_connection(self, respx_mock):
+        """Test that jobs are polled when the event stream is cut off."""
+        respx_mock.get("/v1/batches/batch_123/events").mock(
+            return_value=httpx.Response(200, stream=_DroppedEvents())
+        )
+        route = respx_mock.get("/v1/batches/batch_123").mock(
+            side_effect=[
+                httpx.Response(200, json=_job("processing")),
+                httpx.Response(200, json=_job("completed")),
+            ]
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        with patch("batchrouter.batches.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = [
+                job async for job in client.batches.stream_status("batch_123", poll_interval=1.0)
+            ]
+
+        assert [job.status for job in result] == ["processing", "completed"]
+        assert route.call_count == 2
+        mock_sleep.assert_awaited_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_iter_all(self, respx_mock):
+        """Test iterating over an NDJSON batch listing."""
+        body = "".join(
+            json.dumps(_job("completed", batch_id=batch_id)) + "\n"
+            for batch_id in ("batch_1", "batch_2")
+        )
+        respx_mock.get("/v1/batches").mock(
+            return_value=httpx.Response(
+                200, headers={"content-type": "application/x-ndjson"}, text=body
+            )
+        )
+        client = AsyncBatchRouter(api_key="br_test_key_123")
+
+        result = [job.id async for job in client.batches.iter_all()]
+
+        assert result == ["batch_1", "batch_2"]
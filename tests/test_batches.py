@@ -1,9 +1,33 @@
 """Tests for Batches operations."""
 
+import io
+import json
+
+import httpx
 import pytest
-from unittest.mock import patch
+from unittest.mock import ANY, call, patch
 
 from batchrouter import BatchRouter, BatchJob, BatchCreateResponse
+from batchrouter.exceptions import NotFoundError
+
+
+def _job(status: str) -> dict:
+    """Build a batch job payload with the given status."""
+    return {
+        "id": "batch_123",
+        "dataset_id": "ds_123",
+        "model": "gpt-4o",
+        "status": status,
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+class _DroppedEvents(httpx.SyncByteStream):
+    """An event stream whose connection drops after the first event."""
+
+    def __iter__(self):
+        yield f"data: {json.dumps(_job('processing'))}\n\n".encode()
+        raise httpx.ReadError("Connection reset")
 
 
 class TestBatches:
@@ -14,178 +38,186 @@ class TestBatches:
         """Create a client with mocked HTTP."""
         return BatchRouter(api_key="br_test_key_123")
 
-    def test_create_batch_minimal(self, client):
+    def test_create_batch_minimal(self, client, mock_request):
         """Test creating a batch with minimal parameters."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "batch_123",
-                "status": "pending",
-                "model": "gpt-4o",
-                "provider_id": "prov_1",
-                "provider_name": "openai",
-                "estimated_cost": 0.05,
-            }
-
-            result = client.batches.create(dataset_name="my-dataset")
-
-            assert isinstance(result, BatchCreateResponse)
-            assert result.id == "batch_123"
-            assert result.status == "pending"
-            assert result.model == "gpt-4o"
-            mock_request.assert_called_once_with(
-                "POST",
-                "/v1/batches",
-                json={"dataset_name": "my-dataset", "model": "auto"},
-            )
-
-    def test_create_batch_with_model(self, client):
+        mock_request.return_value = {
+            "id": "batch_123",
+            "status": "pending",
+            "model": "gpt-4o",
+            "provider_id": "prov_1",
+            "provider_name": "openai",
+            "estimated_cost": 0.05,
+        }
+
+        result = client.batches.create(dataset_name="my-dataset")
+
+        assert isinstance(result, BatchCreateResponse)
+        assert result.id == "batch_123"
+        assert result.status == "pending"
+        assert result.model == "gpt-4o"
+        mock_request.assert_called_once_with(
+            "POST",
+            "/v1/batches",
+            json={"dataset_name": "my-dataset", "model": "auto"},
+        )
+
+    def test_create_batch_with_model(self, client, mock_request):
         """Test creating a batch with specific model."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "batch_123",
-                "status": "pending",
-                "model": "claude-3.5-sonnet",
-            }
-
-            result = client.batches.create(
-                dataset_name="my-dataset",
-                model="claude-3.5-sonnet",
-            )
-
-            assert result.model == "claude-3.5-sonnet"
-            call_args = mock_request.call_args
-            assert call_args[1]["json"]["model"] == "claude-3.5-sonnet"
-
-    def test_create_batch_with_provider(self, client):
+        mock_request.return_value = {
+            "id": "batch_123",
+            "status": "pending",
+            "model": "claude-3.5-sonnet",
+        }
+
+        result = client.batches.create(
+            dataset_name="my-dataset",
+            model="claude-3.5-sonnet",
+        )
+
+        assert result.model == "claude-3.5-sonnet"
+        call_args = mock_request.call_args
+        assert call_args[1]["json"]["model"] == "claude-3.5-sonnet"
+
+    def test_create_batch_with_provider(self, client, mock_request):
         """Test creating a batch with specific provider."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "batch_123",
-                "status": "pending",
-                "model": "gpt-4o",
-                "provider_name": "openai",
-            }
-
-            result = client.batches.create(
-                dataset_name="my-dataset",
-                model="gpt-4o",
-                provider="openai",
-            )
-
-            call_args = mock_request.call_args
-            assert call_args[1]["json"]["provider"] == "openai"
-
-    def test_create_batch_with_description(self, client):
+        mock_request.return_value = {
+            "id": "batch_123",
+            "status": "pending",
+            "model": "gpt-4o",
+            "provider_name": "openai",
+        }
+
+        result = client.batches.create(
+            dataset_name="my-dataset",
+            model="gpt-4o",
+            provider="openai",
+        )
+
+        call_args = mock_request.call_args
+        assert call_args[1]["json"]["provider"] == "openai"
+
+    def test_create_batch_with_description(self, client, mock_request):
         """Test creating a batch with description."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "batch_123",
-                "status": "pending",
-                "model": "auto",
-            }
-
-            client.batches.create(
-                dataset_name="my-dataset",
-                description="Test batch job",
-            )
-
-            call_args = mock_request.call_args
-            assert call_args[1]["json"]["description"] == "Test batch job"
-
-    def test_list_batches(self, client):
+        mock_request.return_value = {
+            "id": "batch_123",
+            "status": "pending",
+            "model": "auto",
+        }
+
+        client.batches.create(
+            dataset_name="my-dataset",
+            description="Test batch job",
+        )
+
+        call_args = mock_request.call_args
+        assert call_args[1]["json"]["description"] == "Test batch job"
+
+    def test_create_batch_omits_unset_fields(self, client, mock_request):
+        """Test that only provided optional fields are sent."""
+        mock_request.return_value = {
+            "id": "batch_123",
+            "status": "pending",
+            "model": "auto",
+        }
+
+        client.batches.create(dataset_name="my-dataset", description="Nightly run")
+
+        assert mock_request.call_args[1]["json"] == {
+            "dataset_name": "my-dataset",
+            "model": "auto",
+            "description": "Nightly run",
+        }
+
+    def test_list_batches(self, client, mock_request):
         """Test listing batch jobs."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "data": [
-                    {
-                        "id": "batch_1",
-                        "dataset_id": "ds_1",
-                        "model": "gpt-4o",
-                        "status": "completed",
-                        "request_count": 100,
-                        "completed_count": 100,
-                        "created_at": "2025-01-01T00:00:00Z",
-                    },
-                    {
-                        "id": "batch_2",
-                        "dataset_id": "ds_2",
-                        "model": "claude-3.5-sonnet",
-                        "status": "processing",
-                        "request_count": 50,
-                        "completed_count": 25,
-                        "created_at": "2025-01-02T00:00:00Z",
-                    },
-                ],
-                "total": 2,
-            }
-
-            result = client.batches.list()
-
-            assert len(result) == 2
-            assert all(isinstance(b, BatchJob) for b in result)
-            assert result[0].status == "completed"
-            assert result[1].status == "processing"
-
-    def test_list_batches_with_pagination(self, client):
+        mock_request.return_value = {
+            "data": [
+                {
+                    "id": "batch_1",
+                    "dataset_id": "ds_1",
+                    "model": "gpt-4o",
+                    "status": "completed",
+                    "request_count": 100,
+                    "completed_count": 100,
+                    "created_at": "2025-01-01T00:00:00Z",
+                },
+                {
+                    "id": "batch_2",
+                    "dataset_id": "ds_2",
+                    "model": "claude-3.5-sonnet",
+                    "status": "processing",
+                    "request_count": 50,
+                    "completed_count": 25,
+                    "created_at": "2025-01-02T00:00:00Z",
+                },
+            ],
+            "total": 2,
+        }
+
+        result = client.batches.list()
+
+        assert len(result) == 2
+        assert all(isinstance(b, BatchJob) for b in result)
+        assert result[0].status == "completed"
+        assert result[1].status == "processing"
+
+    def test_list_batches_with_pagination(self, client, mock_request):
         """Test listing batches with pagination."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {"data": [], "total": 0}
+        mock_request.return_value = {"data": [], "total": 0}
 
-            client.batches.list(page=3, page_size=10)
+        client.batches.list(page=3, page_size=10)
 
-            mock_request.assert_called_once_with(
-                "GET",
-                "/v1/batches",
-                params={"page": 3, "page_size": 10},
-            )
+        mock_request.assert_called_once_with(
+            "GET",
+            "/v1/batches",
+            params={"page": 3, "page_size": 10},
+        )
 
-    def test_get_batch(self, client):
+    def test_get_batch(self, client, mock_request):
         """Test getting a batch by ID."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "batch_123",
-                "dataset_id": "ds_123",
-                "dataset_name": "my-dataset",
-                "model": "gpt-4o",
-                "provider_name": "openai",
-                "status": "processing",
-                "request_count": 100,
-                "completed_count": 75,
-                "failed_count": 2,
-                "input_tokens": 50000,
-                "output_tokens": 25000,
-                "estimated_cost": 0.05,
-                "actual_cost": None,
-                "has_results": False,
-                "has_errors": True,
-                "created_at": "2025-01-01T00:00:00Z",
-            }
-
-            result = client.batches.get("batch_123")
-
-            assert isinstance(result, BatchJob)
-            assert result.id == "batch_123"
-            assert result.status == "processing"
-            assert result.completed_count == 75
-            assert result.request_count == 100
-            mock_request.assert_called_once_with("GET", "/v1/batches/batch_123")
-
-    def test_cancel_batch(self, client):
+        mock_request.return_value = {
+            "id": "batch_123",
+            "dataset_id": "ds_123",
+            "dataset_name": "my-dataset",
+            "model": "gpt-4o",
+            "provider_name": "openai",
+            "status": "processing",
+            "request_count": 100,
+            "completed_count": 75,
+            "failed_count": 2,
+            "input_tokens": 50000,
+            "output_tokens": 25000,
+            "estimated_cost": 0.05,
+            "actual_cost": None,
+            "has_results": False,
+            "has_errors": True,
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+
+        result = client.batches.get("batch_123")
+
+        assert isinstance(result, BatchJob)
+        assert result.id == "batch_123"
+        assert result.status == "processing"
+        assert result.completed_count == 75
+        assert result.request_count == 100
+        mock_request.assert_called_once_with("GET", "/v1/batches/batch_123")
+
+    def test_cancel_batch(self, client, mock_request):
         """Test cancelling a batch job."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "batch_123",
-                "dataset_id": "ds_123",
-                "model": "gpt-4o",
-                "status": "cancelled",
-                "created_at": "2025-01-01T00:00:00Z",
-            }
+        mock_request.return_value = {
+            "id": "batch_123",
+            "dataset_id": "ds_123",
+            "model": "gpt-4o",
+            "status": "cancelled",
+            "created_at": "2025-01-01T00:00:00Z",
+        }
 
-            result = client.batches.cancel("batch_123")
+        result = client.batches.cancel("batch_123")
 
-            assert isinstance(result, BatchJob)
-            assert result.status == "cancelled"
-            mock_request.assert_called_once_with("POST", "/v1/batches/batch_123/cancel")
+        assert isinstance(result, BatchJob)
+        assert result.status == "cancelled"
+        mock_request.assert_called_once_with("POST", "/v1/batches/batch_123/cancel")
 
     def test_download_results(self, client):
         """Test downloading batch results."""
@@ -208,3 +240,196 @@ class TestBatches:
             assert isinstance(result, bytes)
             assert b"error" in result
             mock_request.assert_called_once_with("GET", "/v1/batches/batch_123/errors")
+
+    def test_download_results_to_file_object(self, client):
+        """Test streaming batch results into a file-like object."""
+        with patch.object(client, "_stream") as mock_stream:
+            sink = io.BytesIO()
+
+            client.batches.download_results_to("batch_123", sink)
+
+            mock_stream.assert_called_once_with("GET", "/v1/batches/batch_123/results", sink)
+
+    def test_download_errors_to_path(self, client, tmp_path):
+        """Test streaming batch errors into a file path."""
+
+        def fake_stream(method, path, sink):
+            sink.write(b'{"custom_id": "1", "error": "Rate limited"}\n')
+
+        with patch.object(client, "_stream", side_effect=fake_stream) as mock_stream:
+            target = tmp_path / "errors.jsonl"
+
+            client.batches.download_errors_to("batch_123", target)
+
+            assert target.read_bytes() == b'{"custom_id": "1", "error": "Rate limited"}\n'
+            mock_stream.assert_called_once_with("GET", "/v1/batches/batch_123/errors", ANY)
+
+
+class TestBatchWait:
+    """Test waiting for batch jobs to finish."""
+
+    @pytest.fixture
+    def client(self, mock_client):
+        """Create a client with mocked HTTP."""
+        return BatchRouter(api_key="br_test_key_123")
+
+    def test_wait_returns_terminal_job(self, client, mock_request):
+        """Test that wait polls with backoff until a terminal status."""
+        with patch("batchrouter.batches.time.sleep") as mock_sleep:
+            mock_request.side_effect = [
+                _job("pending"),
+                _job("processing"),
+                _job("processing"),
+                _job("completed"),
+            ]
+
+            result = client.batches.wait(
+                "batch_123", poll_interval=2.0, backoff=2.0, max_interval=5.0
+            )
+
+            assert result.status == "completed"
+            assert mock_request.call_count == 4
+            assert mock_sleep.call_args_list == [call(2.0), call(4.0), call(5.0)]
+
+    def test_wait_returns_immediately_when_done(self, client, mock_request):
+        """Test that wait doesn't sleep for an already finished job."""
+        with patch("batchrouter.batches.time.sleep") as mock_sleep:
+            mock_request.return_value = _job("failed")
+
+            result = client.batches.wait("batch_123")
+
+            assert result.status == "failed"
+            mock_sleep.assert_not_called()
+
+    def test_wait_timeout(self, client, mock_request):
+        """Test that wait raises TimeoutError once the deadline passes."""
+        with (
+            patch("batchrouter.batches.time.sleep") as mock_sleep,
+            patch("batchrouter.batches.time.monotonic") as mock_monotonic,
+        ):
+            mock_request.return_value = _job("processing")
+            mock_monotonic.side_effect = [0.0, 8.0, 11.0]
+
+            with pytest.raises(TimeoutError) as exc_info:
+                client.batches.wait("batch_123", poll_interval=5.0, timeout=10.0)
+
+            assert "processing" in str(exc_info.value)
+            assert mock_sleep.call_args_list == [call(2.0)]
+
+
+class TestBatchStreamStatus:
+    """Test streaming batch job status updates."""
+
+    def test_stream_status_events(self, client, respx_mock):
+        """Test that server-sent events are yielded until a terminal status."""
+        events = "\n".join(
+            [
+                "event: status",
+                f"data: {json.dumps(_job('processing'))}",
+                "",
+                f"data: {json.dumps(_job('completed'))}",
+                f"data: {json.dumps(_job('expired'))}",
+            ]
+        )
+        route = respx_mock.get("/v1/batches/batch_123/events").mock(
+            return_value=httpx.Response(200, text=events)
+        )
+
+        result = list(client.batches.stream_status("batch_123"))
+
+        assert [job.status for job in result] == ["processing", "completed"]
+        request = route.calls.last.request
+        assert request.headers["Accept"] == "text/event-stream"
+        assert request.extensions["timeout"]["read"] == client._timeout
+
+    def test_stream_status_falls_back_to_polling(self, client, mock_request):
+        """Test that jobs are polled when the events endpoint is missing."""
+        with (
+            patch.object(client, "_open_stream", side_effect=NotFoundError("Not found")),
+            patch("batchrouter.batches.time.sleep") as mock_sleep,
+        ):
+            mock_request.side_effect = [
+                _job("pending"),
+                _job("pending"),
+                _job("processing"),
+                _job("completed"),
+            ]
+
+            result = list(client.batches.stream_status("batch_123", poll_interval=1.0))
+
+            assert [job.status for job in result] == ["pending", "processing", "completed"]
+            assert mock_request.call_count == 4
+            assert mock_sleep.call_count == 3
+
+    def test_stream_status_polls_after_dropped_connection(self, client, respx_mock):
+        """Test that jobs are polled when the event stream is cut off."""
+        respx_mock.get("/v1/batches/batch_123/events").mock(
+            return_value=httpx.Response(200, stream=_DroppedEvents())
+        )
+        route = respx_mock.get("/v1/batches/batch_123").mock(
+            side_effect=[
+                httpx.Response(200, json=_job("processing")),
+                httpx.Response(200, json=_job("completed")),
+            ]
+        )
+
+        with patch("batchrouter.batches.time.sleep") as mock_sleep:
+            result = list(client.batches.stream_status("batch_123", poll_interval=1.0))
+
+        assert [job.status for job in result] == ["processing", "completed"]
+        assert route.call_count == 2
+        assert mock_sleep.call_args_list == [call(1.0)]
+
+    @pytest.mark.parametrize(
+        "events",
+        [
+            httpx.Response(503, json={"detail": "Service unavailable"}),
+            httpx.ReadTimeout("Timed out"),
+        ],
+        ids=["server_error", "read_timeout"],
+    )
+    def test_stream_status_polls_when_events_fail(self, client, respx_mock, events):
+        """Test that a failing or silent event stream falls back to polling."""
+        respx_mock.get("/v1/batches/batch_123/events").mock(side_effect=[events])
+        respx_mock.get("/v1/batches/batch_123").mock(
+            return_value=httpx.Response(200, json=_job("completed"))
+        )
+
+        result = list(client.batches.stream_status("batch_123"))
+
+        assert [job.status for job in result] == ["completed"]
+
+
+class TestBatchIterAll:
+    """Test iterating over all batch jobs."""
+
+    def test_iter_all_ndjson(self, client, respx_mock):
+        """Test that NDJSON listings are parsed line by line."""
+        body = "\n".join([json.dumps(_job("completed")), "", json.dumps(_job("processing"))])
+        route = respx_mock.get("/v1/batches").mock(
+            return_value=httpx.Response(
+                200, headers={"content-type": "application/x-ndjson"}, text=body
+            )
+        )
+
+        result = list(client.batches.iter_all(page_size=500))
+
+        assert [job.status for job in result] == ["completed", "processing"]
+        assert route.call_count == 1
+        request = route.calls.last.request
+        assert request.headers["Accept"] == "application/x-ndjson"
+        assert request.url.params == httpx.QueryParams(page_size=500)
+
+    def test_iter_all_falls_back_to_pages(self, client, respx_mock):
+        """Test that JSON listings are paged through until has_more is false."""
+        route = respx_mock.get("/v1/batches").mock(
+            side_effect=[
+                httpx.Response(200, json={"data": [_job("completed")], "has_more": True}),
+                httpx.Response(200, json={"data": [_job("failed")], "has_more": False}),
+            ]
+        )
+
+        result = list(client.batches.iter_all(page_size=1))
+
+        assert [job.status for job in result] == ["completed", "failed"]
+        assert route.calls[1].request.url.params == httpx.QueryParams(page=2, page_size=1)
@@ -1,11 +1,28 @@
 """Tests for BatchRouter client initialization."""
 
+import importlib
+import importlib.util
+import io
+import json
 import os
+import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import call, patch
+
+import httpx
 
 from batchrouter import BatchRouter
-from batchrouter.exceptions import AuthenticationError
+from batchrouter.client import DEFAULT_LIMITS, HTTP2_AVAILABLE
+from batchrouter.exceptions import (
+    AuthenticationError,
+    BatchRouterError,
+    NotFoundError,
+    ServerError,
+)
+
+BROTLI_AVAILABLE = any(
+    importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi")
+)
 
 
 class TestClientInit:
@@ -30,13 +47,13 @@ class TestClientInit:
             os.environ.pop("BATCHROUTER_API_KEY", None)
             with pytest.raises(AuthenticationError) as exc_info:
                 BatchRouter()
-            assert "API key is required" in str(exc_info.value)
+            assert "API key is required" in exc_info.value.message
 
     def test_init_with_invalid_key_format(self, mock_client):
         """Test that invalid key format raises AuthenticationError."""
         with pytest.raises(AuthenticationError) as exc_info:
             BatchRouter(api_key="invalid_key_without_prefix")
-        assert "should start with 'br_'" in str(exc_info.value)
+        assert "should start with 'br_'" in exc_info.value.message
 
     def test_init_with_custom_base_url(self, mock_client):
         """Test initialization with custom base URL."""
@@ -46,6 +63,14 @@ class TestClientInit:
         )
         assert client._base_url == "https://custom.api.com"
 
+    @pytest.mark.parametrize("base_url", ["https://custom.api.com", "https://custom.api.com/"])
+    def test_request_paths_joined_to_base_url(self, base_url):
+        """Test that request paths resolve under the /api prefix of base_url."""
+        with BatchRouter(api_key="br_test_key_123", base_url=base_url) as client:
+            request = client._client.build_request("GET", "/v1/batches/batch_123")
+
+        assert request.url == "https://custom.api.com/api/v1/batches/batch_123"
+
     def test_init_with_custom_timeout(self, mock_client):
         """Test initialization with custom timeout."""
         client = BatchRouter(
@@ -61,6 +86,17 @@ class TestClientInit:
         assert hasattr(client, "batches")
         assert hasattr(client, "models")
 
+    def test_resources_created_lazily(self, mock_client):
+        """Test that resource classes are built on first access and reused."""
+        client = BatchRouter(api_key="br_test_key_123")
+        assert "batches" not in vars(client)
+
+        batches = client.batches
+
+        assert client.batches is batches
+        assert batches._client is client
+        assert "datasets" not in vars(client)
+
     def test_context_manager(self, mock_client):
         """Test client works as context manager."""
         with BatchRouter(api_key="br_test_key_123") as client:
@@ -68,6 +104,17 @@ class TestClientInit:
         # close() should have been called
         mock_client.close.assert_called_once()
 
+    def test_transport_configuration(self):
+        """Test that the HTTP transport pools connections and retries connects."""
+        with patch("httpx.HTTPTransport") as mock_transport, patch("httpx.Client") as mock:
+            BatchRouter(api_key="br_test_key_123")
+
+        transport_kwargs = mock_transport.call_args[1]
+        assert transport_kwargs["http2"] == HTTP2_AVAILABLE
+        assert transport_kwargs["limits"] == DEFAULT_LIMITS
+        assert transport_kwargs["retries"] == 2
+        assert mock.call_args[1]["transport"] is mock_transport.return_value
+
 
 class TestClientHeaders:
     """Test client headers."""
@@ -75,9 +122,280 @@ class TestClientHeaders:
     def test_get_headers(self, mock_client):
         """Test that headers are correctly generated."""
         client = BatchRouter(api_key="br_test_key_123")
-        headers = client._get_headers()
+        headers = client._headers_json
 
         assert headers["Authorization"] == "Bearer br_test_key_123"
         assert headers["Content-Type"] == "application/json"
         assert "User-Agent" in headers
         assert "batchrouter-python" in headers["User-Agent"]
+
+    def test_multipart_headers_omit_content_type(self, mock_client):
+        """Test that multipart uploads let httpx set the Content-Type."""
+        client = BatchRouter(api_key="br_test_key_123")
+        headers = client._headers_multipart
+
+        assert headers["Authorization"] == "Bearer br_test_key_123"
+        assert "Content-Type" not in headers
+        assert "batchrouter-python" in headers["User-Agent"]
+
+    def test_upload_request_uses_multipart_headers(self, mock_client):
+        """Test that file uploads are sent without the JSON Content-Type."""
+        mock_client.request.return_value.status_code = 200
+        mock_client.request.return_value.content = b"{}"
+        client = BatchRouter(api_key="br_test_key_123")
+
+        client._request("POST", "/v1/datasets", files={"file": ("a.jsonl", b"{}")})
+        client._request("GET", "/v1/datasets")
+
+        upload_call, get_call = mock_client.request.call_args_list
+        assert upload_call[1]["headers"] is client._headers_multipart
+        assert get_call[1]["headers"] is client._headers_json
+
+    def test_accepts_compressed_responses(self):
+        """Test that requests advertise the encodings httpx can decode."""
+        with BatchRouter(api_key="br_test_key_123") as client:
+            request = client._client.build_request(
+                "GET", "/v1/batches", headers=client._headers_json
+            )
+
+        accept_encoding = request.headers["Accept-Encoding"]
+        assert "gzip" in accept_encoding
+        assert ("br" in accept_encoding) == BROTLI_AVAILABLE
+
+
+class _Unseekable(io.BytesIO):
+    """An upload body that can't be rewound, like a pipe or socket."""
+
+    def seekable(self) -> bool:
+        return False
+
+
+class _BrokenStream(httpx.SyncByteStream):
+    """A response body whose connection drops after the first chunk."""
+
+    def __iter__(self):
+        yield b"partial"
+        raise httpx.ReadError("Connection reset")
+
+
+class TestClientRetries:
+    """Test retrying transient failures."""
+
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        """Record backoff delays instead of sleeping."""
+        with patch("batchrouter.client.time.sleep") as mock:
+            yield mock
+
+    @pytest.mark.parametrize("status_code", [429, 502, 503, 504])
+    def test_retries_transient_status(self, respx_mock, mock_sleep, status_code):
+        """Test that transient responses are retried until success."""
+        route = respx_mock.get("/v1/batches").mock(
+            side_effect=[
+                httpx.Response(status_code),
+                httpx.Response(status_code),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+
+        assert client._request("GET", "/v1/batches") == {"ok": True}
+        assert route.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_gives_up_after_max_retries(self, respx_mock, mock_sleep):
+        """Test that the last error is raised once retries are exhausted."""
+        route = respx_mock.get("/v1/batches").mock(return_value=httpx.Response(503))
+        client = BatchRouter(api_key="br_test_key_123", max_retries=2)
+
+        with pytest.raises(ServerError):
+            client._request("GET", "/v1/batches")
+
+        assert route.call_count == 3
+
+    def test_does_not_retry_client_errors(self, respx_mock, mock_sleep):
+        """Test that non-transient errors fail immediately."""
+        route = respx_mock.get("/v1/batches/nonexistent").mock(return_value=httpx.Response(404))
+        client = BatchRouter(api_key="br_test_key_123")
+
+        with pytest.raises(NotFoundError):
+            client._request("GET", "/v1/batches/nonexistent")
+
+        assert route.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_post_retried_only_on_rate_limit(self, respx_mock, mock_sleep):
+        """Test that non-idempotent requests aren't resent after gateway errors."""
+        route = respx_mock.post("/v1/batches").mock(return_value=httpx.Response(502))
+        client = BatchRouter(api_key="br_test_key_123")
+
+        with pytest.raises(ServerError):
+            client._request("POST", "/v1/batches", json={"dataset_name": "my-dataset"})
+        assert route.call_count == 1
+
+        respx_mock.reset()
+        route.mock(side_effect=[httpx.Response(429), httpx.Response(200, json={})])
+
+        client._request("POST", "/v1/batches", json={"dataset_name": "my-dataset"})
+        assert route.call_count == 2
+
+    def test_retries_transport_errors(self, respx_mock, mock_sleep):
+        """Test that connection failures are retried for idempotent requests."""
+        route = respx_mock.get("/v1/batches").mock(
+            side_effect=[
+                httpx.ConnectError("Connection refused"),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+
+        assert client._request("GET", "/v1/batches") == {"ok": True}
+        assert route.call_count == 2
+
+    def test_transport_error_raised_for_post(self, respx_mock, mock_sleep):
+        """Test that transport errors on non-idempotent requests propagate."""
+        route = respx_mock.post("/v1/batches").mock(side_effect=httpx.ReadTimeout("Timed out"))
+        client = BatchRouter(api_key="br_test_key_123")
+
+        with pytest.raises(httpx.ReadTimeout):
+            client._request("POST", "/v1/batches", json={"dataset_name": "my-dataset"})
+        assert route.call_count == 1
+
+    def test_retry_after_header(self, respx_mock, mock_sleep):
+        """Test that Retry-After is honoured and capped at retry_max."""
+        respx_mock.get("/v1/batches").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(429, headers={"Retry-After": "120"}),
+                httpx.Response(200, json={}),
+            ]
+        )
+        client = BatchRouter(api_key="br_test_key_123", retry_max=30.0)
+
+        client._request("GET", "/v1/batches")
+
+        assert mock_sleep.call_args_list == [call(7.0), call(30.0)]
+
+    def test_backoff_with_jitter(self, respx_mock, mock_sleep):
+        """Test that delays grow exponentially within the jitter range."""
+        respx_mock.get("/v1/batches").mock(return_value=httpx.Response(503))
+        client = BatchRouter(api_key="br_test_key_123", retry_backoff=1.0, max_retries=3)
+
+        with pytest.raises(ServerError):
+            client._request("GET", "/v1/batches")
+
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        for delay, base in zip(delays, [1.0, 2.0, 4.0]):
+            assert base / 2 <= delay <= base
+
+    def test_unseekable_upload_not_retried(self, respx_mock, mock_sleep):
+        """Test that uploads that can't be re-read are not resent."""
+        route = respx_mock.post("/v1/datasets").mock(return_value=httpx.Response(429))
+        client = BatchRouter(api_key="br_test_key_123")
+        stream = _Unseekable(b'{"custom_id": "1"}')
+
+        with pytest.raises(BatchRouterError):
+            client._request("POST", "/v1/datasets", files={"file": ("a.jsonl", stream)})
+        assert route.call_count == 1
+
+    def test_stream_retried_before_body(self, respx_mock, mock_sleep):
+        """Test that streamed downloads retry transient responses."""
+        respx_mock.get("/v1/batches/batch_123/results").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, content=b"data")]
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+        sink = io.BytesIO()
+
+        client._stream("GET", "/v1/batches/batch_123/results", sink)
+
+        assert sink.getvalue() == b"data"
+        assert mock_sleep.call_count == 1
+
+    def test_stream_not_retried_mid_body(self, respx_mock, mock_sleep):
+        """Test that failures after the body started are raised."""
+        route = respx_mock.get("/v1/batches/batch_123/results").mock(
+            return_value=httpx.Response(200, stream=_BrokenStream())
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+
+        with pytest.raises(httpx.ReadError):
+            client._stream("GET", "/v1/batches/batch_123/results", io.BytesIO())
+        assert route.call_count == 1
+
+
+class TestClientJson:
+    """Test JSON encoding of requests and responses."""
+
+    def test_json_body_encoded(self, respx_mock):
+        """Test that JSON payloads are sent as encoded bytes and responses decoded."""
+        route = respx_mock.post("/v1/batches").mock(
+            return_value=httpx.Response(200, json={"id": "batch_123"})
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+
+        result = client._request("POST", "/v1/batches", json={"dataset_name": "my-dataset"})
+
+        assert result == {"id": "batch_123"}
+        request = route.calls.last.request
+        assert json.loads(request.content) == {"dataset_name": "my-dataset"}
+        assert request.headers["Content-Type"] == "application/json"
+
+    def test_no_body_without_json(self, respx_mock):
+        """Test that requests without a JSON payload send no body."""
+        route = respx_mock.delete("/v1/datasets/ds_123").mock(return_value=httpx.Response(204))
+        client = BatchRouter(api_key="br_test_key_123")
+
+        assert client._request("DELETE", "/v1/datasets/ds_123") is None
+        assert route.calls.last.request.content == b""
+
+    def test_stdlib_fallback(self):
+        """Test that JSON helpers fall back to the standard library without orjson."""
+        import batchrouter._json as json_module
+
+        try:
+            with patch.dict(sys.modules, {"orjson": None}):
+                importlib.reload(json_module)
+                assert json_module.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+                assert json_module.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+        finally:
+            importlib.reload(json_module)
+
+
+class TestClientStreaming:
+    """Test streamed downloads."""
+
+    def test_stream_writes_chunks(self, respx_mock):
+        """Test that the response body is written to the sink chunk by chunk."""
+        route = respx_mock.get("/v1/batches/batch_123/results").mock(
+            return_value=httpx.Response(200, content=b'{"a": 1}\n{"b": 2}\n')
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+        sink = io.BytesIO()
+
+        client._stream("GET", "/v1/batches/batch_123/results", sink, chunk_size=4)
+
+        assert sink.getvalue() == b'{"a": 1}\n{"b": 2}\n'
+        assert route.call_count == 1
+
+    def test_request_raw_collects_stream(self, respx_mock):
+        """Test that raw requests return the full streamed body."""
+        respx_mock.get("/v1/batches/batch_123/results").mock(
+            return_value=httpx.Response(200, content=b"part1part2")
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+
+        assert client._request_raw("GET", "/v1/batches/batch_123/results") == b"part1part2"
+
+    def test_stream_error(self, respx_mock):
+        """Test that error responses are read and mapped before streaming."""
+        respx_mock.get("/v1/batches/nonexistent/results").mock(
+            return_value=httpx.Response(404, json={"detail": "Batch not found"})
+        )
+        client = BatchRouter(api_key="br_test_key_123")
+        sink = io.BytesIO()
+
+        with pytest.raises(NotFoundError) as exc_info:
+            client._stream("GET", "/v1/batches/nonexistent/results", sink)
+
+        assert exc_info.value.message == "Batch not found"
+        assert sink.getvalue() == b""
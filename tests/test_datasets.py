@@ -2,72 +2,133 @@
 
 import io
 import pytest
-from unittest.mock import patch, MagicMock
-from datetime import datetime
 
-from batchrouter import BatchRouter, Dataset, DatasetUploadResponse
+import httpx
+
+from batchrouter import Dataset, DatasetUploadResponse
+from batchrouter._json import dumps
+
+
+_FIXTURES = {
+    "list_datasets": {
+        "data": [
+            {
+                "id": "ds_1",
+                "name": "dataset-1",
+                "status": "validated",
+                "record_count": 100,
+                "created_at": "2025-01-01T00:00:00Z",
+            },
+            {
+                "id": "ds_2",
+                "name": "dataset-2",
+                "status": "validated",
+                "record_count": 200,
+                "created_at": "2025-01-02T00:00:00Z",
+            },
+        ],
+        "total": 2,
+    },
+    "dataset": {
+        "id": "ds_123",
+        "name": "my-dataset",
+        "status": "validated",
+        "record_count": 100,
+        "file_size": 5000,
+        "created_at": "2025-01-01T00:00:00Z",
+    },
+}
+
+# Encoded once at import so each mocked response reuses the same bytes
+_FIXTURES_JSON = {name: dumps(payload) for name, payload in _FIXTURES.items()}
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
 class TestDatasets:
     """Test dataset operations."""
 
-    @pytest.fixture
-    def client(self, mock_client):
-        """Create a client with mocked HTTP."""
-        return BatchRouter(api_key="br_test_key_123")
-
-    def test_upload_from_path(self, client, tmp_path):
+    def test_upload_from_path(self, client, respx_mock, sample_jsonl):
         """Test uploading a dataset from file path."""
-        # Create a temp file
-        test_file = tmp_path / "test.jsonl"
-        test_file.write_text('{"custom_id": "1", "messages": [{"role": "user", "content": "Hi"}]}')
-
-        # Mock the request
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "ds_123",
-                "name": "test.jsonl",
-                "status": "pending",
-            }
-
-            result = client.datasets.upload(str(test_file))
-
-            assert isinstance(result, DatasetUploadResponse)
-            assert result.id == "ds_123"
-            assert result.name == "test.jsonl"
-            assert result.status == "pending"
-
-    def test_upload_with_custom_name(self, client, tmp_path):
+        route = respx_mock.post("/v1/datasets").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": "ds_123",
+                    "name": "test.jsonl",
+                    "status": "pending",
+                },
+            )
+        )
+
+        result = client.datasets.upload(str(sample_jsonl))
+
+        assert isinstance(result, DatasetUploadResponse)
+        assert result.id == "ds_123"
+        assert result.name == "test.jsonl"
+        assert result.status == "pending"
+        assert b'filename="test.jsonl"' in route.calls.last.request.content
+
+    def test_upload_with_custom_name(self, client, respx_mock, sample_jsonl):
         """Test uploading with custom name."""
-        test_file = tmp_path / "test.jsonl"
-        test_file.write_text('{"custom_id": "1", "messages": []}')
+        respx_mock.post("/v1/datasets").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": "ds_123",
+                    "name": "custom-name",
+                    "status": "pending",
+                },
+            )
+        )
+
+        result = client.datasets.upload(str(sample_jsonl), name="custom-name")
+
+        assert result.name == "custom-name"
 
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "ds_123",
-                "name": "custom-name",
-                "status": "pending",
-            }
+    def test_upload_many(self, client, respx_mock, tmp_path):
+        """Test uploading several files keeps results in input order."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"part-{i}.jsonl"
+            path.write_text('{"custom_id": "1", "messages": []}')
+            paths.append(path)
 
-            result = client.datasets.upload(str(test_file), name="custom-name")
+        def upload(request):
+            name = request.content.split(b'filename="', 1)[1].split(b'"', 1)[0].decode()
+            return httpx.Response(200, json={"id": f"ds_{name}", "name": name, "status": "pending"})
 
-            assert result.name == "custom-name"
+        route = respx_mock.post("/v1/datasets").mock(side_effect=upload)
 
-    def test_upload_from_file_object(self, client):
+        result = client.datasets.upload_many(paths, concurrency=2)
+
+        assert [r.name for r in result] == [f"part-{i}.jsonl" for i in range(5)]
+        assert route.call_count == 5
+
+    def test_upload_many_requires_positive_concurrency(self, client, tmp_path):
+        """Test that upload_many rejects a concurrency below 1."""
+        with pytest.raises(ValueError) as exc_info:
+            client.datasets.upload_many([tmp_path / "part-0.jsonl"], concurrency=0)
+        assert "concurrency must be at least 1" in str(exc_info.value)
+
+    def test_upload_from_file_object(self, client, respx_mock):
         """Test uploading from file-like object."""
         file_obj = io.BytesIO(b'{"custom_id": "1", "messages": []}')
 
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "ds_123",
-                "name": "my-data",
-                "status": "pending",
-            }
+        respx_mock.post("/v1/datasets").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": "ds_123",
+                    "name": "my-data",
+                    "status": "pending",
+                },
+            )
+        )
 
-            result = client.datasets.upload(file_obj, name="my-data")
+        result = client.datasets.upload(file_obj, name="my-data")
 
-            assert result.id == "ds_123"
-            assert result.name == "my-data"
+        assert result.id == "ds_123"
+        assert result.name == "my-data"
 
     def test_upload_file_object_requires_name(self, client):
         """Test that file object upload requires name."""
@@ -77,109 +138,187 @@ class TestDatasets:
             client.datasets.upload(file_obj)
         assert "name is required" in str(exc_info.value)
 
-    def test_list_datasets(self, client):
+    def test_list_datasets(self, client, respx_mock):
         """Test listing datasets."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "data": [
-                    {
-                        "id": "ds_1",
-                        "name": "dataset-1",
-                        "status": "validated",
-                        "record_count": 100,
-                        "created_at": "2025-01-01T00:00:00Z",
-                    },
-                    {
-                        "id": "ds_2",
-                        "name": "dataset-2",
-                        "status": "validated",
-                        "record_count": 200,
-                        "created_at": "2025-01-02T00:00:00Z",
-                    },
-                ],
-                "total": 2,
-            }
+        respx_mock.get("/v1/datasets").mock(
+            return_value=httpx.Response(
+                200, content=_FIXTURES_JSON["list_datasets"], headers=_JSON_HEADERS
+            )
+        )
 
-            result = client.datasets.list()
+        result = client.datasets.list()
 
-            assert len(result) == 2
-            assert all(isinstance(d, Dataset) for d in result)
-            assert result[0].name == "dataset-1"
-            assert result[1].name == "dataset-2"
+        assert [(type(d), d.name) for d in result] == [
+            (Dataset, "dataset-1"),
+            (Dataset, "dataset-2"),
+        ]
 
-    def test_list_datasets_with_pagination(self, client):
+    def test_list_datasets_with_pagination(self, client, respx_mock):
         """Test listing datasets with pagination."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {"data": [], "total": 0}
+        route = respx_mock.get("/v1/datasets").mock(
+            return_value=httpx.Response(200, json={"data": [], "total": 0})
+        )
 
-            client.datasets.list(page=2, page_size=50)
+        client.datasets.list(page=2, page_size=50)
 
-            mock_request.assert_called_once_with(
-                "GET",
-                "/v1/datasets",
-                params={"page": 2, "page_size": 50},
-            )
+        assert route.call_count == 1
+        assert route.calls.last.request.url.params == httpx.QueryParams(page=2, page_size=50)
 
-    def test_get_dataset(self, client):
+    def test_get_dataset(self, client, respx_mock):
         """Test getting a dataset by ID."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "id": "ds_123",
-                "name": "my-dataset",
-                "status": "validated",
-                "record_count": 100,
-                "file_size": 5000,
-                "created_at": "2025-01-01T00:00:00Z",
-            }
+        route = respx_mock.get("/v1/datasets/ds_123").mock(
+            return_value=httpx.Response(
+                200, content=_FIXTURES_JSON["dataset"], headers=_JSON_HEADERS
+            )
+        )
 
-            result = client.datasets.get("ds_123")
+        result = client.datasets.get("ds_123")
 
-            assert isinstance(result, Dataset)
-            assert result.id == "ds_123"
-            assert result.name == "my-dataset"
-            assert result.record_count == 100
-            mock_request.assert_called_once_with("GET", "/v1/datasets/ds_123")
+        assert isinstance(result, Dataset)
+        assert result.id == "ds_123"
+        assert result.name == "my-dataset"
+        assert result.record_count == 100
+        assert route.call_count == 1
 
-    def test_get_by_name(self, client):
+    def test_get_by_name(self, client, respx_mock):
         """Test getting a dataset by name."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "data": [
-                    {
-                        "id": "ds_1",
-                        "name": "other-dataset",
-                        "status": "validated",
-                        "created_at": "2025-01-01T00:00:00Z",
+        respx_mock.get("/v1/datasets").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": "ds_1",
+                            "name": "other-dataset",
+                            "status": "validated",
+                            "created_at": "2025-01-01T00:00:00Z",
+                        },
+                        {
+                            "id": "ds_2",
+                            "name": "target-dataset",
+                            "status": "validated",
+                            "created_at": "2025-01-02T00:00:00Z",
+                        },
+                    ],
+                },
+            )
+        )
+
+        result = client.datasets.get_by_name("target-dataset")
+
+        assert result is not None
+        assert result.name == "target-dataset"
+        assert result.id == "ds_2"
+
+    def test_get_by_name_not_found(self, client, respx_mock):
+        """Test getting a dataset by name that doesn't exist."""
+        respx_mock.get("/v1/datasets").mock(return_value=httpx.Response(200, json={"data": []}))
+
+        result = client.datasets.get_by_name("nonexistent")
+
+        assert result is None
+
+    def test_get_by_name_scans_pages(self, client, respx_mock):
+        """Test that get_by_name keeps paging until the name is found."""
+        route = respx_mock.get("/v1/datasets").mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={
+                        "data": [
+                            {
+                                "id": "ds_1",
+                                "name": "other-dataset",
+                                "status": "validated",
+                                "created_at": "2025-01-01T00:00:00Z",
+                            },
+                        ],
+                        "has_more": True,
                     },
-                    {
-                        "id": "ds_2",
-                        "name": "target-dataset",
-                        "status": "validated",
-                        "created_at": "2025-01-02T00:00:00Z",
+                ),
+                httpx.Response(
+                    200,
+                    json={
+                        "data": [
+                            {
+                                "id": "ds_2",
+                                "name": "target-dataset",
+                                "status": "validated",
+                                "created_at": "2025-01-02T00:00:00Z",
+                            },
+                        ],
+                        "has_more": False,
                     },
-                ],
-            }
+                ),
+            ]
+        )
+
+        result = client.datasets.get_by_name("target-dataset")
+
+        assert result.id == "ds_2"
+        assert route.calls[1].request.url.params == httpx.QueryParams(page=2, page_size=100)
+
+    def test_get_by_name_uses_known_id(self, client, respx_mock):
+        """Test that names seen in a listing are fetched by ID."""
+        listing = respx_mock.get("/v1/datasets").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": "ds_2",
+                            "name": "target-dataset",
+                            "status": "validated",
+                            "created_at": "2025-01-02T00:00:00Z",
+                        },
+                    ],
+                },
+            )
+        )
+        by_id = respx_mock.get("/v1/datasets/ds_2").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "id": "ds_2",
+                    "name": "target-dataset",
+                    "status": "validated",
+                    "created_at": "2025-01-02T00:00:00Z",
+                },
+            )
+        )
+        client.datasets.list()
 
-            result = client.datasets.get_by_name("target-dataset")
+        result = client.datasets.get_by_name("target-dataset")
 
-            assert result is not None
-            assert result.name == "target-dataset"
-            assert result.id == "ds_2"
+        assert result.id == "ds_2"
+        assert (listing.call_count, by_id.call_count) == (1, 1)
 
-    def test_get_by_name_not_found(self, client):
-        """Test getting a dataset by name that doesn't exist."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {"data": []}
+    def test_get_by_name_stale_id(self, client, respx_mock):
+        """Test that a deleted cached dataset falls back to scanning."""
+        client._dataset_ids["target-dataset"] = "ds_gone"
+        respx_mock.get("/v1/datasets/ds_gone").mock(
+            return_value=httpx.Response(404, json={"detail": "Dataset not found"})
+        )
+        respx_mock.get("/v1/datasets").mock(return_value=httpx.Response(200, json={"data": []}))
+
+        result = client.datasets.get_by_name("target-dataset")
+
+        assert result is None
+        assert "target-dataset" not in client._dataset_ids
+
+    def test_delete_dataset_forgets_name(self, client, respx_mock):
+        """Test that deleting a dataset drops it from the name map."""
+        client._dataset_ids["my-dataset"] = "ds_123"
+        respx_mock.delete("/v1/datasets/ds_123").mock(return_value=httpx.Response(204))
 
-            result = client.datasets.get_by_name("nonexistent")
+        client.datasets.delete("ds_123")
 
-            assert result is None
+        assert "my-dataset" not in client._dataset_ids
 
-    def test_delete_dataset(self, client):
+    def test_delete_dataset(self, client, respx_mock):
         """Test deleting a dataset."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = None
+        route = respx_mock.delete("/v1/datasets/ds_123").mock(return_value=httpx.Response(204))
 
-            client.datasets.delete("ds_123")
+        client.datasets.delete("ds_123")
 
-            mock_request.assert_called_once_with("DELETE", "/v1/datasets/ds_123")
+        assert route.call_count == 1
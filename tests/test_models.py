@@ -3,149 +3,239 @@
 import pytest
 from unittest.mock import patch
 
+import httpx
+
 from batchrouter import BatchRouter, Model, ModelProvider
+from batchrouter._json import dumps
+
+
+_FIXTURES = {
+    "list_models": [
+        {
+            "name": "gpt-4o",
+            "display_name": "GPT-4o",
+            "description": "OpenAI's latest model",
+            "context_window": 128000,
+            "max_output_tokens": 4096,
+            "capabilities": ["chat", "vision"],
+            "providers": [
+                {
+                    "id": "prov_1",
+                    "name": "openai",
+                    "batch_input_price_per_1m": 1.25,
+                    "batch_output_price_per_1m": 5.0,
+                    "is_batch_supported": True,
+                },
+                {
+                    "id": "prov_2",
+                    "name": "together",
+                    "batch_input_price_per_1m": 1.0,
+                    "batch_output_price_per_1m": 4.0,
+                    "is_batch_supported": True,
+                },
+            ],
+        },
+        {
+            "name": "claude-3.5-sonnet",
+            "display_name": "Claude 3.5 Sonnet",
+            "context_window": 200000,
+            "providers": [
+                {
+                    "id": "prov_3",
+                    "name": "anthropic",
+                    "batch_input_price_per_1m": 1.5,
+                    "batch_output_price_per_1m": 7.5,
+                },
+            ],
+        },
+    ],
+    "get_model": {
+        "name": "gpt-4o",
+        "display_name": "GPT-4o",
+        "description": "OpenAI's flagship model",
+        "context_window": 128000,
+        "max_output_tokens": 4096,
+        "capabilities": ["chat", "vision", "function_calling"],
+        "is_deprecated": False,
+        "providers": [
+            {
+                "id": "prov_1",
+                "name": "openai",
+                "batch_input_price_per_1m": 1.25,
+                "batch_output_price_per_1m": 5.0,
+            },
+        ],
+    },
+    "provider_fields": [
+        {
+            "name": "test-model",
+            "providers": [
+                {
+                    "id": "prov_1",
+                    "name": "test-provider",
+                    "batch_input_price_per_1m": 2.5,
+                    "batch_output_price_per_1m": 10.0,
+                    "is_batch_supported": True,
+                },
+            ],
+        },
+    ],
+}
+
+# Encoded once at import so each mocked response reuses the same bytes
+_FIXTURES_JSON = {name: dumps(payload) for name, payload in _FIXTURES.items()}
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
 class TestModels:
     """Test model operations."""
 
+    def test_list_models(self, client, respx_mock):
+        """Test listing all models."""
+        respx_mock.get("/v1/routing/models").mock(
+            return_value=httpx.Response(
+                200, content=_FIXTURES_JSON["list_models"], headers=_JSON_HEADERS
+            )
+        )
+
+        result = client.models.list()
+
+        assert [(type(m), m.name) for m in result] == [
+            (Model, "gpt-4o"),
+            (Model, "claude-3.5-sonnet"),
+        ]
+
+        # Check first model
+        gpt4o = result[0]
+        assert gpt4o.display_name == "GPT-4o"
+        assert gpt4o.context_window == 128000
+        assert "vision" in gpt4o.capabilities
+
+        # Check providers
+        assert [(type(p), p.name, p.batch_input_price_per_1m) for p in gpt4o.providers] == [
+            (ModelProvider, "openai", 1.25),
+            (ModelProvider, "together", 1.0),
+        ]
+
+    def test_list_models_empty(self, client, respx_mock):
+        """Test listing models when none available."""
+        respx_mock.get("/v1/routing/models").mock(return_value=httpx.Response(200, json=[]))
+
+        result = client.models.list()
+
+        assert result == []
+
+    def test_get_model(self, client, respx_mock):
+        """Test getting a specific model."""
+        route = respx_mock.get("/v1/routing/models/gpt-4o").mock(
+            return_value=httpx.Response(
+                200, content=_FIXTURES_JSON["get_model"], headers=_JSON_HEADERS
+            )
+        )
+
+        result = client.models.get("gpt-4o")
+
+        assert isinstance(result, Model)
+        assert result.name == "gpt-4o"
+        assert result.context_window == 128000
+        assert not result.is_deprecated
+        assert route.call_count == 1
+
+    def test_get_model_not_found(self, client, respx_mock):
+        """Test getting a model that doesn't exist."""
+        respx_mock.get("/v1/routing/models/nonexistent-model").mock(
+            return_value=httpx.Response(204)
+        )
+
+        result = client.models.get("nonexistent-model")
+
+        assert result is None
+
+    def test_model_provider_fields(self, client, respx_mock):
+        """Test that model provider has all expected fields."""
+        respx_mock.get("/v1/routing/models").mock(
+            return_value=httpx.Response(
+                200, content=_FIXTURES_JSON["provider_fields"], headers=_JSON_HEADERS
+            )
+        )
+
+        result = client.models.list()
+        provider = result[0].providers[0]
+
+        assert provider.id == "prov_1"
+        assert provider.name == "test-provider"
+        assert provider.batch_input_price_per_1m == 2.5
+        assert provider.batch_output_price_per_1m == 10.0
+        assert provider.is_batch_supported is True
+
+
+class TestModelCache:
+    """Test caching of the model catalogue."""
+
     @pytest.fixture
     def client(self, mock_client):
         """Create a client with mocked HTTP."""
         return BatchRouter(api_key="br_test_key_123")
 
-    def test_list_models(self, client):
-        """Test listing all models."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = [
-                {
-                    "name": "gpt-4o",
-                    "display_name": "GPT-4o",
-                    "description": "OpenAI's latest model",
-                    "context_window": 128000,
-                    "max_output_tokens": 4096,
-                    "capabilities": ["chat", "vision"],
-                    "providers": [
-                        {
-                            "id": "prov_1",
-                            "name": "openai",
-                            "batch_input_price_per_1m": 1.25,
-                            "batch_output_price_per_1m": 5.0,
-                            "is_batch_supported": True,
-                        },
-                        {
-                            "id": "prov_2",
-                            "name": "together",
-                            "batch_input_price_per_1m": 1.0,
-                            "batch_output_price_per_1m": 4.0,
-                            "is_batch_supported": True,
-                        },
-                    ],
-                },
-                {
-                    "name": "claude-3.5-sonnet",
-                    "display_name": "Claude 3.5 Sonnet",
-                    "context_window": 200000,
-                    "providers": [
-                        {
-                            "id": "prov_3",
-                            "name": "anthropic",
-                            "batch_input_price_per_1m": 1.5,
-                            "batch_output_price_per_1m": 7.5,
-                        },
-                    ],
-                },
-            ]
+    def test_list_models_cached(self, client, mock_request):
+        """Test that repeated listings reuse the cached response."""
+        mock_request.return_value = [{"name": "gpt-4o"}]
 
-            result = client.models.list()
+        first = client.models.list()
+        second = client.models.list()
 
-            assert len(result) == 2
-            assert all(isinstance(m, Model) for m in result)
+        assert first == second
+        mock_request.assert_called_once_with("GET", "/v1/routing/models")
 
-            # Check first model
-            gpt4o = result[0]
-            assert gpt4o.name == "gpt-4o"
-            assert gpt4o.display_name == "GPT-4o"
-            assert gpt4o.context_window == 128000
-            assert "vision" in gpt4o.capabilities
-            assert len(gpt4o.providers) == 2
+    def test_cached_models_are_copies(self, client, mock_request):
+        """Test that changing a returned model leaves the cache untouched."""
+        mock_request.return_value = [{"name": "gpt-4o", "capabilities": ["chat"]}]
 
-            # Check providers
-            openai_provider = gpt4o.providers[0]
-            assert isinstance(openai_provider, ModelProvider)
-            assert openai_provider.name == "openai"
-            assert openai_provider.batch_input_price_per_1m == 1.25
+        client.models.list()[0].capabilities.append("vision")
 
-    def test_list_models_empty(self, client):
-        """Test listing models when none available."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = []
+        assert client.models.list()[0].capabilities == ["chat"]
+        mock_request.assert_called_once_with("GET", "/v1/routing/models")
 
-            result = client.models.list()
+    def test_get_model_cached_per_name(self, client, mock_request):
+        """Test that models are cached per name."""
+        mock_request.side_effect = lambda method, path: {"name": path.rsplit("/", 1)[-1]}
 
-            assert result == []
+        assert client.models.get("gpt-4o").name == "gpt-4o"
+        assert client.models.get("claude-3.5-sonnet").name == "claude-3.5-sonnet"
+        assert client.models.get("gpt-4o").name == "gpt-4o"
 
-    def test_get_model(self, client):
-        """Test getting a specific model."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = {
-                "name": "gpt-4o",
-                "display_name": "GPT-4o",
-                "description": "OpenAI's flagship model",
-                "context_window": 128000,
-                "max_output_tokens": 4096,
-                "capabilities": ["chat", "vision", "function_calling"],
-                "is_deprecated": False,
-                "providers": [
-                    {
-                        "id": "prov_1",
-                        "name": "openai",
-                        "batch_input_price_per_1m": 1.25,
-                        "batch_output_price_per_1m": 5.0,
-                    },
-                ],
-            }
-
-            result = client.models.get("gpt-4o")
-
-            assert isinstance(result, Model)
-            assert result.name == "gpt-4o"
-            assert result.context_window == 128000
-            assert not result.is_deprecated
-            mock_request.assert_called_once_with("GET", "/v1/routing/models/gpt-4o")
-
-    def test_get_model_not_found(self, client):
-        """Test getting a model that doesn't exist."""
-        with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = None
+        assert mock_request.call_count == 2
 
-            result = client.models.get("nonexistent-model")
+    def test_invalidate_cache(self, client, mock_request):
+        """Test that invalidating the cache forces a new request."""
+        mock_request.return_value = []
 
-            assert result is None
+        client.models.list()
+        client.invalidate_cache()
+        client.models.list()
+
+        assert mock_request.call_count == 2
+
+    def test_cache_expires(self, client, mock_request):
+        """Test that cached responses expire after the TTL."""
+        with patch("batchrouter.client.time.monotonic") as mock_monotonic:
+            mock_request.return_value = []
+            mock_monotonic.side_effect = [0.0, 100.0, 301.0, 301.0]
+
+            client.models.list()
+            client.models.list()
+            client.models.list()
+
+            assert mock_request.call_count == 2
+
+    def test_cache_disabled(self, mock_client):
+        """Test that cache_ttl=0 disables caching."""
+        client = BatchRouter(api_key="br_test_key_123", cache_ttl=0)
 
-    def test_model_provider_fields(self, client):
-        """Test that model provider has all expected fields."""
         with patch.object(client, "_request") as mock_request:
-            mock_request.return_value = [
-                {
-                    "name": "test-model",
-                    "providers": [
-                        {
-                            "id": "prov_1",
-                            "name": "test-provider",
-                            "batch_input_price_per_1m": 2.5,
-                            "batch_output_price_per_1m": 10.0,
-                            "is_batch_supported": True,
-                        },
-                    ],
-                },
-            ]
+            mock_request.return_value = []
 
-            result = client.models.list()
-            provider = result[0].providers[0]
+            client.models.list()
+            client.models.list()
 
-            assert provider.id == "prov_1"
-            assert provider.name == "test-provider"
-            assert provider.batch_input_price_per_1m == 2.5
-            assert provider.batch_output_price_per_1m == 10.0
-            assert provider.is_batch_supported is True
+            assert mock_request.call_count == 2
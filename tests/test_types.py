@@ -0,0 +1,173 @@
+"""Tests for response types."""
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from batchrouter import BatchJob, Dataset, Model, ModelProvider
+from batchrouter.types import _parse_datetime, _Payload
+
+
+class TestFromDict:
+    """Test building types from API payloads."""
+
+    def test_unknown_fields_are_ignored(self):
+        """Test that fields added server-side don't break parsing."""
+        dataset = Dataset._from_dict(
+            {
+                "id": "ds_1",
+                "name": "dataset-1",
+                "status": "validated",
+                "created_at": "2025-01-01T00:00:00Z",
+                "new_server_field": "ignored",
+            }
+        )
+
+        assert dataset.id == "ds_1"
+        assert not hasattr(dataset, "new_server_field")
+
+    def test_defaults(self):
+        """Test that omitted optional fields fall back to their defaults."""
+        job = BatchJob._from_dict(
+            {
+                "id": "batch_1",
+                "dataset_id": "ds_1",
+                "model": "gpt-4o",
+                "status": "pending",
+                "created_at": "2025-01-01T00:00:00Z",
+            }
+        )
+
+        assert job.provider_name is None
+        assert job.has_results is False
+        assert job.completed_at is None
+
+    def test_nested_providers(self):
+        """Test that model providers are built from nested payloads."""
+        model = Model._from_dict(
+            {"name": "gpt-4o", "providers": [{"id": "prov_1", "name": "openai"}]}
+        )
+
+        assert isinstance(model.providers[0], ModelProvider)
+        assert model.providers[0].is_batch_supported is True
+        assert model.capabilities == []
+
+    def test_matches_generic_constructor(self):
+        """Test that the generated builder matches unpacking the payload."""
+        payload = {
+            "id": "batch_1",
+            "dataset_id": "ds_1",
+            "model": "gpt-4o",
+            "status": "completed",
+            "has_results": True,
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+
+        assert BatchJob._from_dict(payload) == BatchJob(**payload)
+
+    def test_default_factory_not_shared(self):
+        """Test that omitted list fields get a fresh list per instance."""
+        first = Model._from_dict({"name": "gpt-4o"})
+        second = Model._from_dict({"name": "gpt-4o-mini"})
+
+        assert first.capabilities == []
+        assert first.capabilities is not second.capabilities
+
+    def test_missing_required_field(self):
+        """Test that a payload without a required field is rejected."""
+        with pytest.raises(KeyError):
+            Dataset._from_dict({"id": "ds_1", "name": "dataset-1"})
+
+    def test_generic_fallback(self):
+        """Test that payload types without a generated builder still parse."""
+
+        @dataclass(slots=True, kw_only=True)
+        class Usage(_Payload):
+            tokens: int
+            cost: float | None = None
+
+        assert Usage._from_dict({"tokens": 10, "extra": "ignored"}) == Usage(tokens=10)
+
+    def test_slots(self):
+        """Test that instances don't carry a per-instance __dict__."""
+        model = Model(name="gpt-4o")
+
+        assert not hasattr(model, "__dict__")
+
+
+class TestDatetimes:
+    """Test timestamp accessors."""
+
+    def test_timestamps_parsed_on_access(self):
+        """Test that raw timestamps are kept and parsed on demand."""
+        job = BatchJob._from_dict(
+            {
+                "id": "batch_1",
+                "dataset_id": "ds_1",
+                "model": "gpt-4o",
+                "status": "completed",
+                "created_at": "2025-01-01T00:00:00Z",
+                "completed_at": "2025-01-01T01:30:00+00:00",
+            }
+        )
+
+        assert job.created_at == "2025-01-01T00:00:00Z"
+        assert job.created_at_dt == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert job.completed_at_dt == datetime(2025, 1, 1, 1, 30, tzinfo=timezone.utc)
+        assert job.submitted_at_dt is None
+
+    def test_timestamps_parsed_once(self):
+        """Test that parsed timestamps are memoized per instance."""
+        dataset = Dataset._from_dict(
+            {
+                "id": "ds_1",
+                "name": "dataset-1",
+                "status": "validated",
+                "created_at": "2025-01-01T00:00:00Z",
+            }
+        )
+
+        with patch("batchrouter.types._parse_datetime", wraps=_parse_datetime) as mock_parse:
+            first = dataset.created_at_dt
+            second = dataset.created_at_dt
+
+        assert first is second
+        mock_parse.assert_called_once()
+        assert dataset.updated_at_dt is None
+
+    def test_memoized_timestamps_not_compared(self):
+        """Test that reading a timestamp doesn't affect equality or repr."""
+        payload = {
+            "id": "ds_1",
+            "name": "dataset-1",
+            "status": "validated",
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+        parsed = Dataset._from_dict(payload)
+        parsed.created_at_dt
+
+        assert parsed == Dataset._from_dict(payload)
+        assert "_created_at_dt" not in repr(parsed)
+
+    def test_asdict_after_reading_timestamps(self):
+        """Test that memoized timestamps don't leak into asdict()."""
+        payload = {
+            "id": "ds_1",
+            "name": "dataset-1",
+            "description": None,
+            "file_size": None,
+            "record_count": None,
+            "status": "validated",
+            "validation_error": None,
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-02T00:00:00Z",
+        }
+        dataset = Dataset._from_dict(payload)
+        dataset.created_at_dt
+        dataset.updated_at_dt
+
+        assert asdict(dataset) == payload
+        assert json.loads(json.dumps(asdict(dataset))) == payload